@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Entry point for Interview Assistant."""
 
+import logging
 import sys
 import gi
 
@@ -12,6 +13,7 @@ from interview_assistant.app import InterviewAssistantApp
 
 def main():
     """Main entry point."""
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
     app = InterviewAssistantApp()
     return app.run(sys.argv)
 
@@ -57,6 +57,12 @@ class OllamaClient:
             )
         return self._session
 
+    async def close(self) -> None:
+        """Close the pooled HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     async def check_connection(self) -> bool:
         """
         Check if Ollama is running and accessible.
@@ -65,12 +71,12 @@ class OllamaClient:
             True if connected successfully
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/api/tags",
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as response:
-                    return response.status == 200
+            session = await self._get_session()
+            async with session.get(
+                f"{self.base_url}/api/tags",
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                return response.status == 200
         except Exception:
             return False
 
@@ -82,14 +88,14 @@ class OllamaClient:
             List of model names
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/api/tags",
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return [m["name"] for m in data.get("models", [])]
+            session = await self._get_session()
+            async with session.get(
+                f"{self.base_url}/api/tags",
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return [m["name"] for m in data.get("models", [])]
         except Exception as e:
             print(f"Error listing models: {e}")
         return []
@@ -327,10 +333,16 @@ class OllamaClient:
 async def check_ollama_installed() -> bool:
     """Check if Ollama is installed and running."""
     client = OllamaClient()
-    return await client.check_connection()
+    try:
+        return await client.check_connection()
+    finally:
+        await client.close()
 
 
 async def get_available_models() -> List[str]:
     """Get list of available Ollama models."""
     client = OllamaClient()
-    return await client.list_models()
+    try:
+        return await client.list_models()
+    finally:
+        await client.close()
@@ -21,6 +21,7 @@ class ParsedResponse:
     text_sections: List[str]
     code_blocks: List[CodeBlock]
     has_code: bool
+    complexity: Optional[Tuple[str, str]] = None
 
 
 class ResponseParser:
@@ -34,6 +35,27 @@ class ResponseParser:
         re.DOTALL
     )
 
+    # Common patterns for complexity
+    TIME_COMPLEXITY_PATTERN = re.compile(
+        r'[Tt]ime\s*[Cc]omplexity[:\s]*O\(([^)]+)\)',
+        re.IGNORECASE
+    )
+    SPACE_COMPLEXITY_PATTERN = re.compile(
+        r'[Ss]pace\s*[Cc]omplexity[:\s]*O\(([^)]+)\)',
+        re.IGNORECASE
+    )
+
+    # Display formatting: (pattern, replacement) applied in order
+    DISPLAY_RULES = [
+        (re.compile(r'^### (.+)$', re.MULTILINE), r'>>> \1'),
+        (re.compile(r'^## (.+)$', re.MULTILINE), r'>> \1'),
+        (re.compile(r'^# (.+)$', re.MULTILINE), r'> \1'),
+        (re.compile(r'\*\*(.+?)\*\*'), r'[\1]'),
+        (re.compile(r'`([^`]+)`'), r"'\1'"),
+        (re.compile(r'^- ', re.MULTILINE), r'• '),
+        (re.compile(r'^\* ', re.MULTILINE), r'• '),
+    ]
+
     # Common language aliases
     LANGUAGE_ALIASES = {
         'py': 'python',
@@ -93,6 +115,7 @@ class ResponseParser:
             text_sections=text_sections,
             code_blocks=code_blocks,
             has_code=len(code_blocks) > 0,
+            complexity=self.extract_complexity(response),
         )
 
     def _normalize_language(self, language: str) -> str:
@@ -140,22 +163,10 @@ class ResponseParser:
         Returns:
             Formatted text
         """
+        # Headers, bold, inline code, then bullet points
         text = response
-
-        # Convert headers
-        text = re.sub(r'^### (.+)$', r'>>> \1', text, flags=re.MULTILINE)
-        text = re.sub(r'^## (.+)$', r'>> \1', text, flags=re.MULTILINE)
-        text = re.sub(r'^# (.+)$', r'> \1', text, flags=re.MULTILINE)
-
-        # Convert bold
-        text = re.sub(r'\*\*(.+?)\*\*', r'[\1]', text)
-
-        # Convert inline code
-        text = re.sub(r'`([^`]+)`', r"'\1'", text)
-
-        # Convert bullet points (keep as-is mostly)
-        text = re.sub(r'^- ', r'• ', text, flags=re.MULTILINE)
-        text = re.sub(r'^\* ', r'• ', text, flags=re.MULTILINE)
+        for pattern, replacement in self.DISPLAY_RULES:
+            text = pattern.sub(replacement, text)
 
         return text
 
@@ -169,18 +180,8 @@ class ResponseParser:
         Returns:
             Tuple of (time_complexity, space_complexity) or None
         """
-        # Common patterns for complexity
-        time_pattern = re.compile(
-            r'[Tt]ime\s*[Cc]omplexity[:\s]*O\(([^)]+)\)',
-            re.IGNORECASE
-        )
-        space_pattern = re.compile(
-            r'[Ss]pace\s*[Cc]omplexity[:\s]*O\(([^)]+)\)',
-            re.IGNORECASE
-        )
-
-        time_match = time_pattern.search(response)
-        space_match = space_pattern.search(response)
+        time_match = self.TIME_COMPLEXITY_PATTERN.search(response)
+        space_match = self.SPACE_COMPLEXITY_PATTERN.search(response)
 
         if time_match or space_match:
             time_comp = f"O({time_match.group(1)})" if time_match else "N/A"
@@ -190,6 +191,18 @@ class ResponseParser:
         return None
 
 
+# Global instance
+_response_parser: Optional[ResponseParser] = None
+
+
+def get_response_parser() -> ResponseParser:
+    """Get the global response parser instance."""
+    global _response_parser
+    if _response_parser is None:
+        _response_parser = ResponseParser()
+    return _response_parser
+
+
 def parse_response(response: str) -> ParsedResponse:
     """
     Convenience function to parse a response.
@@ -200,7 +213,7 @@ def parse_response(response: str) -> ParsedResponse:
     Returns:
         ParsedResponse object
     """
-    return ResponseParser().parse(response)
+    return get_response_parser().parse(response)
 
 
 def extract_code(response: str) -> List[Tuple[str, str]]:
@@ -213,5 +226,5 @@ def extract_code(response: str) -> List[Tuple[str, str]]:
     Returns:
         List of (language, code) tuples
     """
-    blocks = ResponseParser().extract_code_blocks(response)
+    blocks = get_response_parser().extract_code_blocks(response)
     return [(b.language, b.code) for b in blocks]
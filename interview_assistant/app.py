@@ -1,5 +1,6 @@
 """Main GTK4 Application for Interview Assistant."""
 
+import logging
 import sys
 import gi
 
@@ -108,7 +109,8 @@ class InterviewAssistantApp(Adw.Application):
     def _on_history(self, action, param) -> None:
         """Handle history action."""
         from interview_assistant.ui.history_view import HistoryDialog
-        dialog = HistoryDialog(self.main_window)
+        history = self.main_window.get_history() if self.main_window else []
+        dialog = HistoryDialog(self.main_window, history=history)
         dialog.present()
 
     def _on_about(self, action, param) -> None:
@@ -131,6 +133,7 @@ class InterviewAssistantApp(Adw.Application):
 
 def main():
     """Main entry point."""
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
     app = InterviewAssistantApp()
     return app.run(sys.argv)
 
@@ -47,7 +47,7 @@ class AudioRingBuffer:
             samples: Audio samples as numpy array
         """
         with self._lock:
-            self._buffer.extend(samples.astype(np.int16))
+            self._buffer.extend(samples.astype(np.int16, copy=False))
 
     def read(self, num_samples: int) -> np.ndarray:
         """
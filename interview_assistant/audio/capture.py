@@ -100,9 +100,11 @@ class SystemAudioCapture:
 
     def _process_audio(self, audio: np.ndarray) -> None:
         """Process audio data from any source."""
-        # Convert to int16
-        if audio.dtype == np.float32 or audio.dtype == np.float64:
-            audio_int16 = (audio * 32767).astype(np.int16)
+        # Convert to int16, the pipeline's canonical format
+        is_float = audio.dtype == np.float32 or audio.dtype == np.float64
+        if is_float:
+            audio_int16 = np.empty(len(audio), dtype=np.int16)
+            np.multiply(audio, 32767, out=audio_int16, casting='unsafe')
         elif audio.dtype == np.int16:
             audio_int16 = audio
         else:
@@ -111,14 +113,16 @@ class SystemAudioCapture:
         # Write to buffer
         self.buffer.write_array(audio_int16)
 
-        # Calculate audio level (RMS)
-        audio_float = audio_int16.astype(np.float32) / 32767.0
+        # Calculate audio level (RMS), reusing float input when we have it
+        audio_float = audio if is_float else audio_int16.astype(np.float32) / 32767.0
         rms = np.sqrt(np.mean(audio_float ** 2))
         self._current_level = min(1.0, rms * 10)  # Normalize to 0-1
 
         # Emit events
         self._event_bus.emit(Event.AUDIO_CHUNK, audio_int16, on_main_thread=False)
-        self._event_bus.emit(Event.AUDIO_LEVEL, self._current_level)
+        # Level meters latch this and render from their own timers, so skip
+        # the per-sample main-loop hop
+        self._event_bus.emit(Event.AUDIO_LEVEL, self._current_level, on_main_thread=False)
 
         # Call custom callback if set
         if self._on_audio_chunk:
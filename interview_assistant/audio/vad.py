@@ -1,6 +1,6 @@
 """Voice Activity Detection for audio processing."""
 
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 import numpy as np
 
 
@@ -59,7 +59,55 @@ class SimpleVAD:
         # Calculate energy (RMS)
         energy = np.sqrt(np.mean(audio ** 2))
 
-        is_speech_frame = energy > self.energy_threshold
+        return self.update(energy > self.energy_threshold, len(audio))
+
+    def classify_frames(self, frames: List[np.ndarray]) -> List[bool]:
+        """
+        Classify a batch of frames as speech or not, without updating state.
+
+        The RMS energy of every frame is computed in one vectorised pass.
+
+        Args:
+            frames: Consecutive audio frames (int16 or float32)
+
+        Returns:
+            Per-frame speech flags, to be fed to update() in order
+        """
+        if not frames:
+            return []
+
+        lengths = np.fromiter((len(f) for f in frames), dtype=np.intp, count=len(frames))
+
+        # reduceat cannot represent an empty segment; empty frames are not
+        # speech and add nothing to the concatenated audio
+        nonempty = lengths > 0
+        speech = np.zeros(len(frames), dtype=bool)
+        if not nonempty.any():
+            return speech.tolist()
+
+        audio = np.concatenate(frames)
+        if audio.dtype == np.int16:
+            audio = audio.astype(np.float32) / 32768.0
+
+        kept = lengths[nonempty]
+        offsets = np.zeros_like(kept)
+        np.cumsum(kept[:-1], out=offsets[1:])
+
+        energy = np.sqrt(np.add.reduceat(audio * audio, offsets) / kept)
+        speech[nonempty] = energy > self.energy_threshold
+        return speech.tolist()
+
+    def update(self, is_speech_frame: bool, num_samples: int) -> Tuple[bool, bool]:
+        """
+        Advance the speech state machine by one classified frame.
+
+        Args:
+            is_speech_frame: Whether the frame was classified as speech
+            num_samples: Number of samples in the frame
+
+        Returns:
+            Tuple of (is_speech, speech_ended)
+        """
         speech_ended = False
 
         if is_speech_frame:
@@ -77,7 +125,7 @@ class SimpleVAD:
                 self._speech_frames = 0
                 speech_ended = True
 
-        self._total_samples += len(audio)
+        self._total_samples += num_samples
 
         return self._is_speaking, speech_ended
 
@@ -176,40 +224,76 @@ class SileroVAD:
             return SimpleVAD().process_frame(audio)
 
         try:
-            import torch
+            return self.update(self._speech_prob(audio) > self.threshold, len(audio))
+
+        except Exception as e:
+            print(f"Silero VAD error: {e}")
+            return False, False
 
-            # Normalize to float32
-            if audio.dtype == np.int16:
-                audio = audio.astype(np.float32) / 32768.0
+    def _speech_prob(self, audio: np.ndarray) -> float:
+        """Run the model on one frame and return its speech probability."""
+        import torch
 
-            # Run model
-            tensor = torch.from_numpy(audio)
-            speech_prob = self._model(tensor, self.sample_rate).item()
+        # Normalize to float32
+        if audio.dtype == np.int16:
+            audio = audio.astype(np.float32) / 32768.0
 
-            is_speech = speech_prob > self.threshold
-            speech_ended = False
+        tensor = torch.from_numpy(audio)
+        return self._model(tensor, self.sample_rate).item()
 
-            current_time_ms = len(audio) / self.sample_rate * 1000
+    def classify_frames(self, frames: List[np.ndarray]) -> List[bool]:
+        """
+        Classify a batch of frames as speech or not, without updating state.
 
-            if is_speech:
-                self._silence_start_time = 0
-                if not self._is_speaking:
-                    self._speech_start_time += current_time_ms
-                    if self._speech_start_time >= self.min_speech_duration_ms:
-                        self._is_speaking = True
-            else:
-                self._speech_start_time = 0
-                if self._is_speaking:
-                    self._silence_start_time += current_time_ms
-                    if self._silence_start_time >= self.min_silence_duration_ms:
-                        self._is_speaking = False
-                        speech_ended = True
+        The model is recurrent across calls, so frames are run in order
+        rather than stacked into one batch.
 
-            return self._is_speaking, speech_ended
+        Args:
+            frames: Consecutive audio frames (int16 or float32)
 
+        Returns:
+            Per-frame speech flags, to be fed to update() in order
+        """
+        self._load_model()
+
+        if self._model is None:
+            return SimpleVAD().classify_frames(frames)
+
+        try:
+            return [self._speech_prob(audio) > self.threshold for audio in frames]
         except Exception as e:
             print(f"Silero VAD error: {e}")
-            return False, False
+            return [False] * len(frames)
+
+    def update(self, is_speech: bool, num_samples: int) -> Tuple[bool, bool]:
+        """
+        Advance the speech state machine by one classified frame.
+
+        Args:
+            is_speech: Whether the frame was classified as speech
+            num_samples: Number of samples in the frame
+
+        Returns:
+            Tuple of (is_speech, speech_ended)
+        """
+        speech_ended = False
+        current_time_ms = num_samples / self.sample_rate * 1000
+
+        if is_speech:
+            self._silence_start_time = 0
+            if not self._is_speaking:
+                self._speech_start_time += current_time_ms
+                if self._speech_start_time >= self.min_speech_duration_ms:
+                    self._is_speaking = True
+        else:
+            self._speech_start_time = 0
+            if self._is_speaking:
+                self._silence_start_time += current_time_ms
+                if self._silence_start_time >= self.min_silence_duration_ms:
+                    self._is_speaking = False
+                    speech_ended = True
+
+        return self._is_speaking, speech_ended
 
     def is_speech(self, audio: np.ndarray) -> bool:
         """Check if audio contains speech."""
@@ -0,0 +1,45 @@
+"""Shared background event loop for running coroutines from the UI thread."""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the shared background event loop, starting it on first use.
+
+    The loop runs forever on a daemon thread, so callers pay the loop and
+    thread setup once per process instead of once per call.
+
+    Returns:
+        The running background event loop
+    """
+    global _loop
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="async-runtime",
+                daemon=True,
+            ).start()
+            _loop = loop
+    return _loop
+
+
+def submit(coro: Coroutine[Any, Any, Any]) -> Future:
+    """
+    Run a coroutine on the shared background loop.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Future resolved with the coroutine's result (or exception)
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_loop())
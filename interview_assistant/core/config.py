@@ -1,5 +1,6 @@
 """Configuration management for Interview Assistant."""
 
+import os
 from pathlib import Path
 from typing import Optional
 from enum import Enum
@@ -137,8 +138,23 @@ class AppConfig(BaseSettings):
         if "ai" in data and "api_key" in data["ai"]:
             data["ai"]["api_key"] = self.ai.api_key.get_secret_value()
 
-        with open(path, "wb") as f:
+        # The file holds the API key: keep the current mode, or owner-only
+        # for a new file
+        try:
+            mode = path.stat().st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o600
+
+        # Write beside the target, sync it and swap it in, so a crash
+        # mid-write never leaves a truncated config behind
+        tmp_path = path.with_name(path.name + ".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), mode)  # O_CREAT leaves an existing tmp's mode
             tomli_w.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
 
 
 # Global config instance
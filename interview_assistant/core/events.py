@@ -46,6 +46,7 @@ class Event(Enum):
 
     # History events
     HISTORY_UPDATED = auto()
+    HISTORY_ITEM_ADDED = auto()
     HISTORY_CLEARED = auto()
 
 
@@ -74,6 +75,18 @@ class EventBus:
             if callback not in self._subscribers[event]:
                 self._subscribers[event].append(callback)
 
+    def subscribe_many(self, handlers: Dict[Event, Callable[[Any], None]]) -> None:
+        """
+        Subscribe to several events under a single lock acquisition.
+
+        Args:
+            handlers: Mapping of event to callback
+        """
+        with self._lock:
+            for event, callback in handlers.items():
+                if callback not in self._subscribers[event]:
+                    self._subscribers[event].append(callback)
+
     def unsubscribe(self, event: Event, callback: Callable[[Any], None]) -> None:
         """
         Unsubscribe from an event.
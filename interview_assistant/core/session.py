@@ -19,7 +19,7 @@ class InterviewType(str, Enum):
 @dataclass
 class QAPair:
     """A question-answer pair."""
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=lambda: uuid4().hex)
     question: str = ""
     answer: str = ""
     timestamp: datetime = field(default_factory=datetime.now)
@@ -43,7 +43,7 @@ class InterviewSession:
 
     Tracks questions, answers, and session metadata.
     """
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=lambda: uuid4().hex)
     interview_type: InterviewType = InterviewType.DSA
     started_at: datetime = field(default_factory=datetime.now)
     ended_at: Optional[datetime] = None
@@ -98,7 +98,7 @@ class InterviewSession:
         self.is_processing = False
 
         self._event_bus.emit(Event.AI_RESPONSE_COMPLETE, qa_pair)
-        self._event_bus.emit(Event.HISTORY_UPDATED, self.qa_pairs)
+        self._event_bus.emit(Event.HISTORY_ITEM_ADDED, qa_pair)
 
         return qa_pair
 
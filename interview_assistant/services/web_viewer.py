@@ -1,6 +1,8 @@
 """Web server to view answers on phone/tablet."""
 
 import asyncio
+import html
+import re
 import threading
 import json
 from typing import Optional
@@ -8,6 +10,20 @@ from aiohttp import web
 
 from interview_assistant.core.events import Event, get_event_bus
 
+# Fixed headers and idle payload for /api/state, built once
+_STATE_HEADERS = {'Content-Type': 'application/json'}
+_EMPTY_STATE_BYTES = json.dumps(
+    {'question': '', 'answer': '', 'answer_html': '', 'streaming': False}
+).encode('utf-8')
+
+# Basic markdown-like formatting, applied once per answer update
+_CODE_BLOCK_RE = re.compile(r'```([\s\S]*?)```')
+_INLINE_CODE_RE = re.compile(r'`([^`]+)`')
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+
+# Streaming tokens are folded into the served answer at most this often
+_TOKEN_FLUSH_INTERVAL = 0.05
+
 
 class WebViewer:
     """
@@ -23,34 +39,67 @@ class WebViewer:
         self._site = None
         self._thread = None
         self._loop = None
+        # Keeps a shutdown scheduled by stop() alive until it runs
+        self._stop_task: Optional[asyncio.Task] = None
 
         self._current_question = ""
         self._current_answer = ""
+        self._answer_html = ""
         self._answer_chunks = []
+        self._streaming = False
+        self._flush_scheduled = False
+
+        # Encoded /api/state body, rebuilt only when the state version changes
+        self._state_version = 0
+        self._state_cache: Optional[tuple] = None
 
         self._event_bus = get_event_bus()
         self._setup_events()
 
     def _setup_events(self):
         """Subscribe to events."""
-        self._event_bus.subscribe(Event.TRANSCRIPTION_COMPLETE, self._on_question)
-        self._event_bus.subscribe(Event.AI_TOKEN_RECEIVED, self._on_token)
-        self._event_bus.subscribe(Event.AI_RESPONSE_COMPLETE, self._on_answer_complete)
+        self._event_bus.subscribe_many({
+            Event.TRANSCRIPTION_COMPLETE: self._on_question,
+            Event.AI_TOKEN_RECEIVED: self._on_token,
+            Event.AI_RESPONSE_COMPLETE: self._on_answer_complete,
+        })
 
     def _on_question(self, text: str):
         """Handle new question."""
         self._current_question = text
-        self._current_answer = ""
         self._answer_chunks = []
+        self._streaming = False
+        self._set_answer("")
 
     def _on_token(self, token: str):
         """Handle streaming token."""
         self._answer_chunks.append(token)
-        self._current_answer = "".join(self._answer_chunks)
+        self._streaming = True
+
+        # Batch tokens so the served answer is rebuilt at most once per interval
+        if self._flush_scheduled or not self._loop or not self._loop.is_running():
+            return
+        self._flush_scheduled = True
+        self._loop.call_soon_threadsafe(
+            self._loop.call_later, _TOKEN_FLUSH_INTERVAL, self._flush_tokens
+        )
+
+    def _flush_tokens(self):
+        """Fold pending streamed tokens into the current answer."""
+        self._flush_scheduled = False
+        if self._streaming:
+            self._set_answer("".join(self._answer_chunks))
 
     def _on_answer_complete(self, answer: str):
         """Handle complete answer."""
+        self._streaming = False
+        self._set_answer(answer)
+
+    def _set_answer(self, answer: str):
+        """Update the answer and its pre-rendered HTML."""
         self._current_answer = answer
+        self._answer_html = _format_markdown(answer)
+        self._state_version += 1
 
     async def _handle_index(self, request):
         """Serve the main page."""
@@ -155,13 +204,7 @@ class WebViewer:
         const answerEl = document.getElementById('answer');
         const statusEl = document.getElementById('status');
 
-        function formatAnswer(text) {
-            // Basic markdown-like formatting
-            return text
-                .replace(/```([\s\S]*?)```/g, '<pre><code>$1</code></pre>')
-                .replace(/`([^`]+)`/g, '<code>$1</code>')
-                .replace(/\*\*([^*]+)\*\*/g, '<strong>$1</strong>');
-        }
+        let lastAnswerHtml = null;
 
         function poll() {
             fetch('/api/state')
@@ -178,12 +221,17 @@ class WebViewer:
                         questionEl.className = 'question empty';
                     }
 
-                    if (data.answer) {
-                        answerEl.innerHTML = formatAnswer(data.answer);
+                    if (data.answer_html) {
+                        // Formatted server-side; only touch the DOM on change
+                        if (data.answer_html !== lastAnswerHtml) {
+                            answerEl.innerHTML = data.answer_html;
+                            lastAnswerHtml = data.answer_html;
+                        }
                         answerEl.className = 'answer' + (data.streaming ? ' typing' : '');
                     } else {
                         answerEl.textContent = 'Answer will appear here...';
                         answerEl.className = 'answer empty';
+                        lastAnswerHtml = null;
                     }
                 })
                 .catch(err => {
@@ -202,53 +250,86 @@ class WebViewer:
 
     async def _handle_state(self, request):
         """Return current state as JSON."""
-        return web.json_response({
-            'question': self._current_question,
-            'answer': self._current_answer,
-            'streaming': len(self._answer_chunks) > 0 and self._current_answer != "".join(self._answer_chunks),
-        })
+        if not self._current_question and not self._current_answer:
+            return web.Response(body=_EMPTY_STATE_BYTES, headers=_STATE_HEADERS)
+
+        key = (self._state_version, self._streaming)
+        if self._state_cache is None or self._state_cache[0] != key:
+            body = json.dumps({
+                'question': self._current_question,
+                'answer': self._current_answer,
+                'answer_html': self._answer_html,
+                'streaming': self._streaming,
+            }).encode('utf-8')
+            self._state_cache = (key, body)
+
+        return web.Response(body=self._state_cache[1], headers=_STATE_HEADERS)
+
+    async def start_async(self) -> None:
+        """Start the server on the currently running event loop."""
+        app = web.Application()
+        app.router.add_get('/', self._handle_index)
+        app.router.add_get('/api/state', self._handle_state)
+
+        runner = web.AppRunner(app)
+        await runner.setup()
+
+        # Only a bound site is recorded, so a failed bind (e.g. port in use)
+        # does not make start() think the server is up
+        site = web.TCPSite(runner, '0.0.0.0', self.port)
+        try:
+            await site.start()
+        except BaseException:
+            await runner.cleanup()
+            raise
+
+        self._loop = asyncio.get_running_loop()
+        self._app = app
+        self._runner = runner
+        self._site = site
 
     def _run_server(self):
         """Run the server in a thread."""
-        self._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._loop)
-
-        self._app = web.Application()
-        self._app.router.add_get('/', self._handle_index)
-        self._app.router.add_get('/api/state', self._handle_state)
-
-        self._runner = web.AppRunner(self._app)
-        self._loop.run_until_complete(self._runner.setup())
-
-        self._site = web.TCPSite(self._runner, '0.0.0.0', self.port)
-        self._loop.run_until_complete(self._site.start())
-
-        self._loop.run_forever()
+        # Use uvloop for this server's loop when available, without
+        # changing the global policy for the app's other loops
+        try:
+            import uvloop
+            loop = uvloop.new_event_loop()
+        except ImportError:
+            loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
 
-    def start(self) -> str:
+        try:
+            loop.run_until_complete(self.start_async())
+            loop.run_forever()
+        except Exception as e:
+            print(f"Web viewer server error: {e}")
+        finally:
+            loop.close()
+            self._loop = None
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> str:
         """
         Start the web server.
 
+        Args:
+            loop: Running event loop to host the server on. When omitted, the
+                server gets its own loop in a background thread.
+
         Returns:
             URL to access the viewer
         """
-        if self._thread and self._thread.is_alive():
+        if self._site or (self._thread and self._thread.is_alive()):
             return self._get_url()
 
-        self._thread = threading.Thread(target=self._run_server, daemon=True)
-        self._thread.start()
-
-        # Get local IP
-        import socket
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            ip = s.getsockname()[0]
-            s.close()
-        except Exception:
-            ip = "localhost"
+        if loop is not None and loop.is_running():
+            fut = asyncio.run_coroutine_threadsafe(self.start_async(), loop)
+            fut.add_done_callback(_report_start_error)
+        else:
+            self._thread = threading.Thread(target=self._run_server, daemon=True)
+            self._thread.start()
 
-        url = f"http://{ip}:{self.port}"
+        url = self._get_url()
         print(f"\n{'='*50}")
         print(f"Phone Viewer available at: {url}")
         print(f"Open this URL on your phone to see answers!")
@@ -268,10 +349,74 @@ class WebViewer:
             ip = "localhost"
         return f"http://{ip}:{self.port}"
 
+    async def _shutdown(self):
+        """Stop the site and release the runner's sockets."""
+        if self._site:
+            await self._site.stop()
+            self._site = None
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def stop_async(self) -> None:
+        """Stop the server from a coroutine running on its hosting loop."""
+        loop = self._loop
+        if not loop:
+            return
+
+        await self._shutdown()
+
+        # Our own loop: stopping it lets _run_server close it
+        if self._thread:
+            loop.stop()
+            self._thread = None
+        else:
+            self._loop = None
+
     def stop(self):
         """Stop the server."""
-        if self._loop:
+        if not self._loop or not self._loop.is_running():
+            return
+
+        # On the hosting loop's own thread, waiting for the shutdown would
+        # block the very loop that has to run it
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._stop_task = self._loop.create_task(self.stop_async())
+            return
+
+        fut = asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+        try:
+            fut.result(timeout=2)
+        except Exception as e:
+            print(f"Error shutting down web viewer: {e}")
+
+        # Only stop the loop if it is the one we created
+        if self._thread:
             self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=2)
+            self._thread = None
+        else:
+            self._loop = None
+
+
+def _report_start_error(fut) -> None:
+    """Print why a server started on a caller's loop failed to come up."""
+    if not fut.cancelled() and fut.exception() is not None:
+        print(f"Web viewer failed to start: {fut.exception()}")
+
+
+def _format_markdown(text: str) -> str:
+    """Render the answer's basic markdown to escaped HTML."""
+    if not text:
+        return ""
+    result = html.escape(text, quote=False)
+    result = _CODE_BLOCK_RE.sub(r'<pre><code>\1</code></pre>', result)
+    result = _INLINE_CODE_RE.sub(r'<code>\1</code>', result)
+    return _BOLD_RE.sub(r'<strong>\1</strong>', result)
 
 
 # Global instance
@@ -1,11 +1,25 @@
 """Screen-share avoidance modules."""
 
-from .x11_bypass import X11StealthWindow
-from .display_manager import DisplayManager
-from .hotkey_popup import HotkeyPopupMode
+import importlib
+
+# Submodules pull in GTK/Xlib, so they are only imported on first access
+_LAZY_IMPORTS = {
+    "X11StealthWindow": ".x11_bypass",
+    "DisplayManager": ".display_manager",
+    "HotkeyPopupMode": ".hotkey_popup",
+}
 
 __all__ = [
     "X11StealthWindow",
     "DisplayManager",
     "HotkeyPopupMode",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,7 +6,7 @@ gi.require_version("Gdk", "4.0")
 from gi.repository import Gtk, Gdk
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -44,11 +44,48 @@ class DisplayManager:
     def __init__(self):
         self._display = Gdk.Display.get_default()
         self._monitors: List[MonitorInfo] = []
+        self._gdk_monitors: Dict[int, Gdk.Monitor] = {}
+        # Monitors whose property signals are connected -> handler ids
+        self._watched: Dict[Gdk.Monitor, List[int]] = {}
         self._refresh_monitors()
 
+        # Monitor info is cached; re-query only after the outputs change
+        self._stale = False
+        if self._display is not None:
+            self._display.get_monitors().connect("items-changed", self._on_monitors_changed)
+
+    def _on_monitors_changed(self, model, position, removed, added) -> None:
+        """Mark cached monitor info stale when outputs are added or removed."""
+        self._stale = True
+
+    def _on_monitor_property_changed(self, monitor, pspec) -> None:
+        """Mark cached monitor info stale when an output is resized or rescaled."""
+        self._stale = True
+
+    def _watch_monitors(self, monitors: List[Gdk.Monitor]) -> None:
+        """Follow geometry and scale changes of the current monitors."""
+        for monitor in list(self._watched):
+            if monitor not in monitors:
+                for handler_id in self._watched.pop(monitor):
+                    monitor.disconnect(handler_id)
+
+        for monitor in monitors:
+            if monitor not in self._watched:
+                self._watched[monitor] = [
+                    monitor.connect(signal, self._on_monitor_property_changed)
+                    for signal in ("notify::geometry", "notify::scale-factor")
+                ]
+
+    def _ensure_monitors(self) -> None:
+        """Re-query monitors if they changed since the last query."""
+        if self._stale:
+            self._stale = False
+            self._refresh_monitors()
+
     def _refresh_monitors(self) -> None:
         """Refresh the list of available monitors."""
         self._monitors = []
+        self._gdk_monitors = {}
 
         if self._display is None:
             return
@@ -81,13 +118,18 @@ class DisplayManager:
                 refresh_rate=monitor.get_refresh_rate() / 1000.0,  # Convert to Hz
             )
             self._monitors.append(info)
+            self._gdk_monitors[i] = monitor
+
+        self._watch_monitors(list(self._gdk_monitors.values()))
 
     def get_monitors(self) -> List[MonitorInfo]:
         """Get list of all monitors."""
+        self._ensure_monitors()
         return self._monitors.copy()
 
     def get_primary_monitor(self) -> Optional[MonitorInfo]:
         """Get the primary monitor."""
+        self._ensure_monitors()
         for m in self._monitors:
             if m.is_primary:
                 return m
@@ -95,6 +137,7 @@ class DisplayManager:
 
     def get_secondary_monitors(self) -> List[MonitorInfo]:
         """Get all non-primary monitors."""
+        self._ensure_monitors()
         return [m for m in self._monitors if not m.is_primary]
 
     def get_monitor_at_window(self, window: Gtk.Window) -> Optional[MonitorInfo]:
@@ -121,6 +164,7 @@ class DisplayManager:
             return self.get_primary_monitor()
 
         # Find matching MonitorInfo
+        self._ensure_monitors()
         geo = monitor.get_geometry()
         for m in self._monitors:
             if m.x == geo.x and m.y == geo.y:
@@ -147,11 +191,16 @@ class DisplayManager:
             if self._display is None:
                 return False
 
-            monitors = self._display.get_monitors()
-            if monitor.index >= monitors.get_n_items():
+            self._ensure_monitors()
+            gdk_monitor = self._gdk_monitors.get(monitor.index)
+            if gdk_monitor is None:
                 return False
 
-            gdk_monitor = monitors.get_item(monitor.index)
+            # Skip the compositor round-trip if already there
+            if window.is_fullscreen():
+                current = self.get_monitor_at_window(window)
+                if current is not None and current.index == monitor.index:
+                    return True
 
             # Fullscreen on the target monitor
             window.fullscreen_on_monitor(gdk_monitor)
@@ -187,6 +236,7 @@ class DisplayManager:
 
     def has_multiple_monitors(self) -> bool:
         """Check if system has multiple monitors."""
+        self._ensure_monitors()
         return len(self._monitors) > 1
 
     def refresh(self) -> None:
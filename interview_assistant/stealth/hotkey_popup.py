@@ -78,22 +78,32 @@ class HotkeyPopupMode:
         # Add new content
         self._content_box.append(widget)
 
+    def _cancel_hide(self) -> None:
+        """Cancel the pending auto-hide timer, if any."""
+        timer_id = self._hide_timer
+        self._hide_timer = None
+        if timer_id:
+            try:
+                GLib.source_remove(timer_id)
+            except Exception:
+                pass
+
     def show(self) -> None:
-        """Show the popup."""
+        """Show the popup (or keep it up longer if it is already showing)."""
         # Cancel any existing hide timer
-        if self._hide_timer:
-            GLib.source_remove(self._hide_timer)
-            self._hide_timer = None
+        self._cancel_hide()
 
-        # Position near cursor or center
-        self._position_popup()
+        # Already up: skip the window-manager raise, just restart the timer
+        if not self._popup.get_visible():
+            # Position near cursor or center
+            self._position_popup()
 
-        # Show the popup
-        self._popup.present()
+            # Show the popup
+            self._popup.present()
 
-        # Callback
-        if self._on_show:
-            self._on_show()
+            # Callback
+            if self._on_show:
+                self._on_show()
 
         # Start auto-hide timer
         if self._auto_hide_ms > 0:
@@ -104,9 +114,7 @@ class HotkeyPopupMode:
 
     def hide(self) -> None:
         """Hide the popup."""
-        if self._hide_timer:
-            GLib.source_remove(self._hide_timer)
-            self._hide_timer = None
+        self._cancel_hide()
 
         self._popup.hide()
 
@@ -122,6 +130,8 @@ class HotkeyPopupMode:
 
     def _auto_hide(self) -> bool:
         """Auto-hide callback."""
+        # The source is being dispatched; returning False removes it
+        self._hide_timer = None
         self.hide()
         return False  # Don't repeat
 
@@ -150,8 +160,7 @@ class HotkeyPopupMode:
         Args:
             additional_ms: Additional time to add
         """
-        if self._hide_timer:
-            GLib.source_remove(self._hide_timer)
+        self._cancel_hide()
 
         self._hide_timer = GLib.timeout_add(
             additional_ms,
@@ -195,6 +204,10 @@ class AnswerPopup(HotkeyPopupMode):
             auto_hide_ms=config.stealth.auto_hide_timeout,
         )
 
+        # Streamed text waiting to be inserted on the next idle
+        self._pending_text: list = []
+        self._flush_scheduled = False
+
         # Build answer display
         self._build_ui()
 
@@ -253,12 +266,11 @@ class AnswerPopup(HotkeyPopupMode):
         """Handle pin button toggle."""
         if button.get_active():
             # Disable auto-hide
-            if self._hide_timer:
-                GLib.source_remove(self._hide_timer)
-                self._hide_timer = None
+            self._cancel_hide()
         else:
             # Re-enable auto-hide
             if self.is_visible:
+                self._cancel_hide()
                 self._hide_timer = GLib.timeout_add(
                     self._auto_hide_ms,
                     self._auto_hide
@@ -266,13 +278,26 @@ class AnswerPopup(HotkeyPopupMode):
 
     def set_answer(self, text: str) -> None:
         """Set the answer text."""
+        self._pending_text.clear()
         self._buffer.set_text(text)
 
     def append_answer(self, text: str) -> None:
-        """Append to the answer text."""
-        end_iter = self._buffer.get_end_iter()
-        self._buffer.insert(end_iter, text)
+        """Append to the answer text (coalesced into one insert per idle)."""
+        self._pending_text.append(text)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            GLib.idle_add(self._flush_pending)
+
+    def _flush_pending(self) -> bool:
+        """Insert all pending text in a single buffer mutation."""
+        self._flush_scheduled = False
+        if self._pending_text:
+            text = "".join(self._pending_text)
+            self._pending_text.clear()
+            self._buffer.insert(self._buffer.get_end_iter(), text)
+        return False
 
     def clear(self) -> None:
         """Clear the answer."""
+        self._pending_text.clear()
         self._buffer.set_text("")
@@ -5,7 +5,7 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Gdk", "4.0")
 from gi.repository import Gtk, Gdk, GLib
 
-from typing import Optional
+from typing import Dict, Optional
 
 
 class X11StealthWindow:
@@ -35,6 +35,16 @@ class X11StealthWindow:
         'utility': '_NET_WM_WINDOW_TYPE_UTILITY',
     }
 
+    # Atoms interned once per display connection
+    ATOM_NAMES = (
+        '_NET_WM_WINDOW_TYPE',
+        '_NET_WM_STATE',
+        '_NET_WM_STATE_SKIP_TASKBAR',
+        '_NET_WM_STATE_SKIP_PAGER',
+        '_NET_WM_STATE_ABOVE',
+        '_NET_WM_BYPASS_COMPOSITOR',
+    ) + tuple(WINDOW_TYPES.values())
+
     def __init__(self, gtk_window: Gtk.Window):
         """
         Initialize X11 stealth window.
@@ -46,12 +56,17 @@ class X11StealthWindow:
         self._display = None
         self._x_window = None
         self._original_type = None
+        self._atoms: Dict[str, int] = {}
+
+        # The X window is stable while the surface exists; drop it on unrealize
+        self.window.connect("unrealize", self._on_window_unrealize)
 
         # Try to import Xlib
         try:
             from Xlib import display as xdisplay
             from Xlib import X, Xatom
             self._xlib_available = True
+            self._xdisplay = xdisplay
             self._X = X
             self._Xatom = Xatom
         except ImportError:
@@ -63,9 +78,10 @@ class X11StealthWindow:
         if not self._xlib_available:
             return None
 
-        try:
-            from Xlib import display as xdisplay
+        if self._x_window is not None:
+            return self._x_window
 
+        try:
             surface = self.window.get_surface()
             if surface is None:
                 return None
@@ -75,7 +91,8 @@ class X11StealthWindow:
                 xid = surface.get_xid()
 
                 if self._display is None:
-                    self._display = xdisplay.Display()
+                    self._display = self._xdisplay.Display()
+                    self._intern_atoms()
 
                 self._x_window = self._display.create_resource_object('window', xid)
                 return self._x_window
@@ -85,12 +102,47 @@ class X11StealthWindow:
 
         return None
 
-    def apply_stealth_mode(self, mode: str) -> bool:
+    def _on_window_unrealize(self, widget) -> None:
+        """Forget the cached X window when the GTK surface goes away."""
+        self._x_window = None
+
+    def _intern_atoms(self) -> None:
+        """Intern all atoms used by this class on the current display."""
+        from Xlib.protocol import request
+
+        # Queue every InternAtom request before reading any reply so the
+        # whole table costs a single round-trip
+        pending = {
+            name: request.InternAtom(
+                display=self._display.display,
+                defer=True,
+                name=name,
+                only_if_exists=0,
+            )
+            for name in self.ATOM_NAMES
+        }
+        self._display.flush()
+
+        atoms = {}
+        for name, req in pending.items():
+            req.reply()
+            atoms[name] = req.atom
+        self._atoms = atoms
+
+    def _send(self, sync: bool) -> None:
+        """Push queued requests to the server, optionally waiting for them."""
+        if sync:
+            self._display.sync()
+        else:
+            self._display.flush()
+
+    def apply_stealth_mode(self, mode: str, sync: bool = False) -> bool:
         """
         Apply stealth properties to the window.
 
         Args:
             mode: Stealth mode ('dock', 'popup', 'tooltip', etc.)
+            sync: Wait for the X server to process the change
 
         Returns:
             True if applied successfully
@@ -108,8 +160,8 @@ class X11StealthWindow:
                 return False
 
             # Get atoms
-            type_atom = self._display.intern_atom('_NET_WM_WINDOW_TYPE')
-            window_type_atom = self._display.intern_atom(window_type)
+            type_atom = self._atoms['_NET_WM_WINDOW_TYPE']
+            window_type_atom = self._atoms[window_type]
 
             # Store original type
             if self._original_type is None:
@@ -128,14 +180,97 @@ class X11StealthWindow:
                 [window_type_atom]
             )
 
-            self._display.sync()
+            self._send(sync)
             return True
 
         except Exception as e:
             print(f"Error applying stealth mode: {e}")
             return False
 
-    def set_skip_taskbar(self, skip: bool = True) -> bool:
+    def apply_profile(
+        self,
+        mode: Optional[str] = None,
+        skip_taskbar: bool = True,
+        on_top: bool = True,
+        bypass: Optional[bool] = None,
+    ) -> bool:
+        """
+        Apply a full stealth profile with a single server round-trip.
+
+        All property changes are queued back-to-back and synced once,
+        instead of syncing after each individual setter.
+
+        Args:
+            mode: Stealth mode ('dock', 'popup', 'tooltip', etc.), or None
+                to keep the current window type
+            skip_taskbar: Whether to skip taskbar/pager
+            on_top: Whether to stay on top
+            bypass: Compositor bypass hint, or None to leave it unchanged
+
+        Returns:
+            True if applied successfully
+        """
+        if not self._xlib_available:
+            return False
+
+        x_window = self._get_x11_window()
+        if x_window is None:
+            return False
+
+        try:
+            if mode is not None:
+                window_type = self.WINDOW_TYPES.get(mode)
+                if not window_type:
+                    return False
+
+                type_atom = self._atoms['_NET_WM_WINDOW_TYPE']
+
+                # Store original type
+                if self._original_type is None:
+                    try:
+                        self._original_type = x_window.get_full_property(
+                            type_atom, self._Xatom.ATOM
+                        )
+                    except Exception:
+                        pass
+
+                x_window.change_property(
+                    type_atom,
+                    self._Xatom.ATOM,
+                    32,
+                    [self._atoms[window_type]]
+                )
+
+            states = []
+            if skip_taskbar:
+                states.append(self._atoms['_NET_WM_STATE_SKIP_TASKBAR'])
+                states.append(self._atoms['_NET_WM_STATE_SKIP_PAGER'])
+            if on_top:
+                states.append(self._atoms['_NET_WM_STATE_ABOVE'])
+
+            x_window.change_property(
+                self._atoms['_NET_WM_STATE'],
+                self._Xatom.ATOM,
+                32,
+                states
+            )
+
+            if bypass is not None:
+                x_window.change_property(
+                    self._atoms['_NET_WM_BYPASS_COMPOSITOR'],
+                    self._Xatom.CARDINAL,
+                    32,
+                    [1 if bypass else 0]
+                )
+
+            self._display.sync()
+            return True
+
+        except Exception as e:
+            print(f"Error applying stealth profile: {e}")
+            return False
+
+    def set_skip_taskbar(self, skip: bool = True, sync: bool = False) -> bool:
         """
         Set the window to skip taskbar and pager.
 
@@ -143,6 +278,7 @@ class X11StealthWindow:
 
         Args:
             skip: Whether to skip taskbar/pager
+            sync: Wait for the X server to process the change
 
         Returns:
             True if applied successfully
@@ -155,9 +291,9 @@ class X11StealthWindow:
             return False
 
         try:
-            state_atom = self._display.intern_atom('_NET_WM_STATE')
-            skip_taskbar = self._display.intern_atom('_NET_WM_STATE_SKIP_TASKBAR')
-            skip_pager = self._display.intern_atom('_NET_WM_STATE_SKIP_PAGER')
+            state_atom = self._atoms['_NET_WM_STATE']
+            skip_taskbar = self._atoms['_NET_WM_STATE_SKIP_TASKBAR']
+            skip_pager = self._atoms['_NET_WM_STATE_SKIP_PAGER']
 
             states = [skip_taskbar, skip_pager] if skip else []
 
@@ -168,19 +304,20 @@ class X11StealthWindow:
                 states
             )
 
-            self._display.sync()
+            self._send(sync)
             return True
 
         except Exception as e:
             print(f"Error setting skip taskbar: {e}")
             return False
 
-    def set_always_on_top(self, on_top: bool = True) -> bool:
+    def set_always_on_top(self, on_top: bool = True, sync: bool = False) -> bool:
         """
         Set the window to always stay on top.
 
         Args:
             on_top: Whether to stay on top
+            sync: Wait for the X server to process the change
 
         Returns:
             True if applied successfully
@@ -193,8 +330,8 @@ class X11StealthWindow:
             return False
 
         try:
-            state_atom = self._display.intern_atom('_NET_WM_STATE')
-            above_atom = self._display.intern_atom('_NET_WM_STATE_ABOVE')
+            state_atom = self._atoms['_NET_WM_STATE']
+            above_atom = self._atoms['_NET_WM_STATE_ABOVE']
 
             # Get current states
             current = x_window.get_full_property(state_atom, self._Xatom.ATOM)
@@ -214,14 +351,14 @@ class X11StealthWindow:
                 states
             )
 
-            self._display.sync()
+            self._send(sync)
             return True
 
         except Exception as e:
             print(f"Error setting always on top: {e}")
             return False
 
-    def set_compositor_bypass(self, bypass: bool = True) -> bool:
+    def set_compositor_bypass(self, bypass: bool = True, sync: bool = False) -> bool:
         """
         Set compositor bypass hint.
 
@@ -229,6 +366,7 @@ class X11StealthWindow:
 
         Args:
             bypass: Whether to bypass compositor
+            sync: Wait for the X server to process the change
 
         Returns:
             True if applied successfully
@@ -241,7 +379,7 @@ class X11StealthWindow:
             return False
 
         try:
-            bypass_atom = self._display.intern_atom('_NET_WM_BYPASS_COMPOSITOR')
+            bypass_atom = self._atoms['_NET_WM_BYPASS_COMPOSITOR']
 
             x_window.change_property(
                 bypass_atom,
@@ -250,7 +388,7 @@ class X11StealthWindow:
                 [1 if bypass else 0]
             )
 
-            self._display.sync()
+            self._send(sync)
             return True
 
         except Exception as e:
@@ -274,7 +412,7 @@ class X11StealthWindow:
         try:
             # Restore original window type
             if self._original_type:
-                type_atom = self._display.intern_atom('_NET_WM_WINDOW_TYPE')
+                type_atom = self._atoms['_NET_WM_WINDOW_TYPE']
                 x_window.change_property(
                     type_atom,
                     self._Xatom.ATOM,
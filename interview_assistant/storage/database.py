@@ -6,8 +6,8 @@ from typing import List, Optional
 from uuid import uuid4
 from datetime import datetime
 
-from sqlalchemy import create_engine, select, delete
-from sqlalchemy.orm import sessionmaker, Session as DBSession
+from sqlalchemy import column, create_engine, event, func, select, delete, text
+from sqlalchemy.orm import scoped_session, selectinload, sessionmaker, Session as DBSession
 
 from interview_assistant.core.config import CONFIG_DIR
 from interview_assistant.core.session import QAPair, InterviewType
@@ -17,6 +17,76 @@ from .models import Base, Session, Question, Answer, InterviewTypeDB
 # Database path
 DB_PATH = CONFIG_DIR / "history.db"
 
+# Full-text index over question/answer text, kept in sync by triggers.
+# questions has no INTEGER PRIMARY KEY (VACUUM may renumber its rowid), so
+# qa_fts_map gives each question a stable integer that is used as its
+# qa_fts rowid; the triggers then reach index rows by rowid instead of
+# scanning for a column value. The trigram tokenizer preserves substring
+# matching.
+_FTS_SCHEMA = [
+    """CREATE VIRTUAL TABLE qa_fts USING fts5(
+        question, answer, tokenize='trigram'
+    )""",
+    """CREATE TABLE qa_fts_map (
+        fts_rowid INTEGER PRIMARY KEY,
+        question_id TEXT NOT NULL UNIQUE
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS qa_fts_question_insert AFTER INSERT ON questions BEGIN
+        INSERT INTO qa_fts_map(question_id) VALUES (new.id);
+        INSERT INTO qa_fts(rowid, question, answer)
+        VALUES (
+            (SELECT fts_rowid FROM qa_fts_map WHERE question_id = new.id),
+            new.question_text, ''
+        );
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS qa_fts_question_delete AFTER DELETE ON questions BEGIN
+        DELETE FROM qa_fts
+        WHERE rowid = (SELECT fts_rowid FROM qa_fts_map WHERE question_id = old.id);
+        DELETE FROM qa_fts_map WHERE question_id = old.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS qa_fts_answer_insert AFTER INSERT ON answers BEGIN
+        UPDATE qa_fts SET answer = new.answer_text
+        WHERE rowid = (SELECT fts_rowid FROM qa_fts_map WHERE question_id = new.question_id);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS qa_fts_answer_delete AFTER DELETE ON answers BEGIN
+        UPDATE qa_fts SET answer = ''
+        WHERE rowid = (SELECT fts_rowid FROM qa_fts_map WHERE question_id = old.question_id);
+    END""",
+    """INSERT INTO qa_fts_map(question_id) SELECT id FROM questions""",
+    """INSERT INTO qa_fts(rowid, question, answer)
+        SELECT m.fts_rowid, q.question_text, COALESCE(a.answer_text, '')
+        FROM qa_fts_map m
+        JOIN questions q ON q.id = m.question_id
+        LEFT JOIN answers a ON a.question_id = q.id""",
+]
+
+# Removes an index built by an older schema so it can be recreated
+_FTS_DROP = [
+    "DROP TRIGGER IF EXISTS qa_fts_question_insert",
+    "DROP TRIGGER IF EXISTS qa_fts_question_delete",
+    "DROP TRIGGER IF EXISTS qa_fts_answer_insert",
+    "DROP TRIGGER IF EXISTS qa_fts_answer_delete",
+    "DROP TABLE IF EXISTS qa_fts",
+    "DROP TABLE IF EXISTS qa_fts_map",
+]
+
+# Trigram queries need at least this many characters
+_FTS_MIN_QUERY_LENGTH = 3
+
+# Interview type conversions between the session and database enums
+_DB_FROM_CORE = {t: InterviewTypeDB(t.value) for t in InterviewType}
+_CORE_FROM_DB = {v: k for k, v in _DB_FROM_CORE.items()}
+
+
+def _set_sqlite_pragmas(dbapi_conn, connection_record) -> None:
+    """Use WAL journaling and relaxed fsync for every new connection."""
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
 
 class Database:
     """
@@ -41,17 +111,79 @@ class Database:
             f"sqlite:///{self.db_path}",
             echo=False,
         )
+        event.listen(self.engine, "connect", _set_sqlite_pragmas)
 
         # Create tables
         Base.metadata.create_all(self.engine)
 
-        # Session factory
-        self.SessionLocal = sessionmaker(bind=self.engine)
+        # create_all skips existing tables, so add indexes to older databases
+        for index in Question.__table__.indexes:
+            index.create(self.engine, checkfirst=True)
+
+        self._fts_enabled = self._setup_fts()
+
+        # Thread-local session registry; each thread reuses its Session and
+        # the pool reuses the underlying SQLite connection between calls
+        self.SessionLocal = scoped_session(sessionmaker(bind=self.engine))
+
+    def _setup_fts(self) -> bool:
+        """Create the full-text search index if SQLite supports it."""
+        try:
+            with self.engine.begin() as conn:
+                tables = set(conn.execute(text(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE name IN ('qa_fts', 'qa_fts_map')"
+                )).scalars())
+
+                # Older indexes have no rowid map; rebuild them
+                if tables and tables != {"qa_fts", "qa_fts_map"}:
+                    for statement in _FTS_DROP:
+                        conn.execute(text(statement))
+                    tables = set()
+
+                if not tables:
+                    for statement in _FTS_SCHEMA:
+                        conn.execute(text(statement))
+            return True
+
+        except Exception as e:
+            print(f"Full-text search unavailable, using LIKE search: {e}")
+            return False
 
     def _get_session(self) -> DBSession:
-        """Get a database session."""
+        """
+        Get this thread's database session.
+
+        Callers use it as a context manager; closing it only releases the
+        connection back to the pool, the Session itself is reused.
+        """
         return self.SessionLocal()
 
+    def _build_rows(self, qa: QAPair, session_id: Optional[str]) -> list:
+        """Build the Question/Answer rows for a Q&A pair."""
+        # Convert interview type
+        interview_type = _DB_FROM_CORE[qa.interview_type]
+
+        # Create question
+        question = Question(
+            id=qa.id,
+            session_id=session_id,
+            question_text=qa.question,
+            timestamp=qa.timestamp,
+            interview_type=interview_type,
+        )
+
+        # Create answer
+        answer = Answer(
+            id=uuid4().hex,
+            question_id=qa.id,
+            answer_text=qa.answer,
+            timestamp=datetime.now(),
+        )
+
+        # Linked by question_id; the relationship setter isn't needed
+        return [question, answer]
+
     def save_qa_pair(self, qa: QAPair, session_id: Optional[str] = None) -> bool:
         """
         Save a Q&A pair to the database.
@@ -65,34 +197,39 @@ class Database:
         """
         try:
             with self._get_session() as session:
-                # Convert interview type
-                interview_type = InterviewTypeDB(qa.interview_type.value)
-
-                # Create question
-                question = Question(
-                    id=qa.id,
-                    session_id=session_id,
-                    question_text=qa.question,
-                    timestamp=qa.timestamp,
-                    interview_type=interview_type,
-                )
+                session.add_all(self._build_rows(qa, session_id))
+                session.commit()
+                return True
 
-                # Create answer
-                answer = Answer(
-                    id=str(uuid4()),
-                    question_id=qa.id,
-                    answer_text=qa.answer,
-                    timestamp=datetime.now(),
-                )
+        except Exception as e:
+            print(f"Error saving Q&A pair: {e}")
+            return False
+
+    def save_qa_pairs(self, pairs: List[QAPair], session_id: Optional[str] = None) -> bool:
+        """
+        Save several Q&A pairs in a single transaction.
 
-                question.answer = answer
+        Args:
+            pairs: QAPairs to save
+            session_id: Optional session ID to associate with
 
-                session.add(question)
+        Returns:
+            True if saved successfully
+        """
+        if not pairs:
+            return True
+
+        try:
+            with self._get_session() as session:
+                rows = []
+                for qa in pairs:
+                    rows.extend(self._build_rows(qa, session_id))
+                session.add_all(rows)
                 session.commit()
                 return True
 
         except Exception as e:
-            print(f"Error saving Q&A pair: {e}")
+            print(f"Error saving Q&A pairs: {e}")
             return False
 
     def get_all_qa_pairs(self, limit: int = 100) -> List[QAPair]:
@@ -107,7 +244,12 @@ class Database:
         """
         try:
             with self._get_session() as session:
-                stmt = select(Question).order_by(Question.timestamp.desc()).limit(limit)
+                stmt = (
+                    select(Question)
+                    .options(selectinload(Question.answer))
+                    .order_by(Question.timestamp.desc())
+                    .limit(limit)
+                )
                 questions = session.execute(stmt).scalars().all()
 
                 result = []
@@ -117,7 +259,7 @@ class Database:
                         question=q.question_text,
                         answer=q.answer.answer_text if q.answer else "",
                         timestamp=q.timestamp,
-                        interview_type=InterviewType(q.interview_type.value),
+                        interview_type=_CORE_FROM_DB[q.interview_type],
                     )
                     result.append(qa)
 
@@ -140,9 +282,10 @@ class Database:
         """
         try:
             with self._get_session() as session:
-                db_type = InterviewTypeDB(interview_type.value)
+                db_type = _DB_FROM_CORE[interview_type]
                 stmt = (
                     select(Question)
+                    .options(selectinload(Question.answer))
                     .where(Question.interview_type == db_type)
                     .order_by(Question.timestamp.desc())
                     .limit(limit)
@@ -179,14 +322,26 @@ class Database:
         """
         try:
             with self._get_session() as session:
-                # Simple LIKE search
-                pattern = f"%{query}%"
-                stmt = (
-                    select(Question)
-                    .where(
+                if self._fts_enabled and len(query) >= _FTS_MIN_QUERY_LENGTH:
+                    # Substring match via the trigram index
+                    phrase = '"' + query.replace('"', '""') + '"'
+                    matches = text(
+                        "SELECT question_id FROM qa_fts_map WHERE fts_rowid IN "
+                        "(SELECT rowid FROM qa_fts WHERE qa_fts MATCH :phrase)"
+                    ).columns(column("question_id")).bindparams(phrase=phrase)
+                    condition = Question.id.in_(matches)
+                else:
+                    # Simple LIKE search
+                    pattern = f"%{query}%"
+                    condition = (
                         (Question.question_text.like(pattern)) |
                         (Question.answer.has(Answer.answer_text.like(pattern)))
                     )
+
+                stmt = (
+                    select(Question)
+                    .options(selectinload(Question.answer))
+                    .where(condition)
                     .order_by(Question.timestamp.desc())
                     .limit(limit)
                 )
@@ -199,7 +354,7 @@ class Database:
                         question=q.question_text,
                         answer=q.answer.answer_text if q.answer else "",
                         timestamp=q.timestamp,
-                        interview_type=InterviewType(q.interview_type.value),
+                        interview_type=_CORE_FROM_DB[q.interview_type],
                     )
                     result.append(qa)
 
@@ -258,16 +413,20 @@ class Database:
         """
         try:
             with self._get_session() as session:
-                total_questions = session.query(Question).count()
                 total_sessions = session.query(Session).count()
 
-                # Count by type
-                by_type = {}
-                for t in InterviewTypeDB:
-                    count = session.query(Question).filter(
-                        Question.interview_type == t
-                    ).count()
-                    by_type[t.value] = count
+                # Count by type in a single grouped scan
+                rows = session.execute(
+                    select(Question.interview_type, func.count())
+                    .group_by(Question.interview_type)
+                ).all()
+
+                by_type = {t.value: 0 for t in InterviewTypeDB}
+                total_questions = 0
+                for interview_type, count in rows:
+                    total_questions += count
+                    if interview_type is not None:
+                        by_type[interview_type.value] = count
 
                 return {
                     "total_questions": total_questions,
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, String, Text, DateTime, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, Enum as SQLEnum, ForeignKey, Index
 from sqlalchemy.orm import declarative_base, relationship
 import enum
 
@@ -22,7 +22,7 @@ class Session(Base):
 
     __tablename__ = "sessions"
 
-    id = Column(String(36), primary_key=True)
+    id = Column(String(32), primary_key=True)
     interview_type = Column(SQLEnum(InterviewTypeDB), default=InterviewTypeDB.DSA)
     started_at = Column(DateTime, default=datetime.now)
     ended_at = Column(DateTime, nullable=True)
@@ -44,11 +44,15 @@ class Question(Base):
     """Question model."""
 
     __tablename__ = "questions"
+    __table_args__ = (
+        # Matches the filter + ordering of get_qa_pairs_by_type
+        Index("ix_questions_type_timestamp", "interview_type", "timestamp"),
+    )
 
-    id = Column(String(36), primary_key=True)
-    session_id = Column(String(36), ForeignKey("sessions.id"), nullable=True)
+    id = Column(String(32), primary_key=True)
+    session_id = Column(String(32), ForeignKey("sessions.id"), nullable=True)
     question_text = Column(Text, nullable=False)
-    timestamp = Column(DateTime, default=datetime.now)
+    timestamp = Column(DateTime, default=datetime.now, index=True)
     interview_type = Column(SQLEnum(InterviewTypeDB), default=InterviewTypeDB.DSA)
 
     # Relationships
@@ -72,8 +76,8 @@ class Answer(Base):
 
     __tablename__ = "answers"
 
-    id = Column(String(36), primary_key=True)
-    question_id = Column(String(36), ForeignKey("questions.id"), nullable=False)
+    id = Column(String(32), primary_key=True)
+    question_id = Column(String(32), ForeignKey("questions.id"), nullable=False)
     answer_text = Column(Text, nullable=False)
     timestamp = Column(DateTime, default=datetime.now)
     model_used = Column(String(100), nullable=True)
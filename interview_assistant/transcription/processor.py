@@ -29,6 +29,45 @@ class TextProcessor:
         "gimme": "give me",
     }
 
+    # Words that typically open a question
+    QUESTION_WORDS = frozenset([
+        "what", "how", "why", "when", "where", "who", "which",
+        "can", "could", "would", "should", "is", "are", "do", "does",
+        "tell", "explain", "describe", "walk",
+    ])
+
+    # Phrases that typically start a question inside longer text
+    QUESTION_STARTERS = [
+        "what", "how", "why", "when", "where", "who",
+        "which", "can you", "could you", "would you",
+        "is there", "are there", "do you", "does",
+        "tell me", "explain", "describe",
+    ]
+
+    # Punctuation removed before word comparisons
+    _PUNCT_TABLE = str.maketrans('', '', '.,!?;:')
+
+    # Precompiled patterns
+    _WHITESPACE_RE = re.compile(r'\s+')
+    _CLEANUP_RE = re.compile(
+        r'(?P<before_punct>\s+(?=[.,!?;:]))'
+        r'|(?P<ws>\s+)'
+        r'|(?P<after_punct>(?<=[.,!?;:])(?=[A-Za-z]))'
+    )
+    _SENTENCE_START_RE = re.compile(r'(^(?:[.!?]+\s*)?|[.!?]+\s*)([^.!?])')
+    _FILLER_RE = re.compile(
+        r'(?<!\S)(?:'
+        + '|'.join(sorted(map(re.escape, FILLER_WORDS), key=len, reverse=True))
+        + r')[.,!?;:]*(?!\S)',
+        re.IGNORECASE,
+    )
+    _STARTERS_RE = re.compile(
+        r'\b(?:' + '|'.join(map(re.escape, QUESTION_STARTERS)) + r')\b', re.IGNORECASE
+    )
+    _CORRECTIONS_RE = re.compile(
+        r'\b(' + '|'.join(map(re.escape, CORRECTIONS)) + r')\b', re.IGNORECASE
+    )
+
     def __init__(
         self,
         remove_fillers: bool = False,
@@ -79,63 +118,33 @@ class TextProcessor:
 
     def _clean_whitespace(self, text: str) -> str:
         """Clean up whitespace."""
-        # Remove multiple spaces
-        text = re.sub(r'\s+', ' ', text)
-        # Remove space before punctuation
-        text = re.sub(r'\s+([.,!?;:])', r'\1', text)
-        # Add space after punctuation if missing
-        text = re.sub(r'([.,!?;:])([A-Za-z])', r'\1 \2', text)
-        return text.strip()
+        # Collapse runs of whitespace, drop whitespace before punctuation and
+        # add a missing space after it, all in a single scan
+        return self._CLEANUP_RE.sub(self._cleanup_replacement, text).strip()
+
+    @staticmethod
+    def _cleanup_replacement(match: re.Match) -> str:
+        """Replacement for a _CLEANUP_RE match."""
+        return '' if match.lastgroup == 'before_punct' else ' '
 
     def _remove_filler_words(self, text: str) -> str:
         """Remove filler words from text."""
-        words = text.split()
-        filtered = []
-
-        for i, word in enumerate(words):
-            word_lower = word.lower().strip('.,!?;:')
-
-            # Check single filler words
-            if word_lower in self.FILLER_WORDS:
-                continue
-
-            # Check multi-word fillers
-            skip = False
-            for filler in self.FILLER_WORDS:
-                if ' ' in filler:
-                    filler_words = filler.split()
-                    if i + len(filler_words) <= len(words):
-                        phrase = ' '.join(w.lower().strip('.,!?;:')
-                                         for w in words[i:i+len(filler_words)])
-                        if phrase == filler:
-                            skip = True
-                            break
-
-            if not skip:
-                filtered.append(word)
-
-        return ' '.join(filtered)
+        # Whole-word single and multi-word fillers (with trailing punctuation)
+        text = self._FILLER_RE.sub('', text)
+        return self._WHITESPACE_RE.sub(' ', text).strip()
 
     def _apply_corrections(self, text: str) -> str:
         """Apply common word corrections."""
-        for wrong, correct in self.CORRECTIONS.items():
-            # Case-insensitive replacement
-            pattern = re.compile(re.escape(wrong), re.IGNORECASE)
-            text = pattern.sub(correct, text)
-        return text
+        # Case-insensitive replacement, all corrections in one pass
+        return self._CORRECTIONS_RE.sub(
+            lambda m: self.CORRECTIONS[m.group(1).lower()], text
+        )
 
     def _capitalize_sentences(self, text: str) -> str:
         """Capitalize the first letter of sentences."""
-        # Split by sentence endings
-        sentences = re.split(r'([.!?]+\s*)', text)
-
-        result = []
-        for i, part in enumerate(sentences):
-            if i % 2 == 0 and part:  # Sentence content
-                part = part[0].upper() + part[1:] if part else part
-            result.append(part)
-
-        return ''.join(result)
+        return self._SENTENCE_START_RE.sub(
+            lambda m: m.group(1) + m.group(2).upper(), text
+        )
 
     def extract_question(self, text: str) -> Optional[str]:
         """
@@ -149,25 +158,20 @@ class TextProcessor:
         Returns:
             Extracted question or None
         """
-        # Look for text ending with question mark
-        questions = re.findall(r'[^.!?]*\?', text)
-        if questions:
-            return questions[-1].strip()
-
-        # Look for question words
-        question_starters = [
-            "what", "how", "why", "when", "where", "who",
-            "which", "can you", "could you", "would you",
-            "is there", "are there", "do you", "does",
-            "tell me", "explain", "describe",
-        ]
-
-        text_lower = text.lower()
-        for starter in question_starters:
-            if starter in text_lower:
-                # Extract from the question word to the end
-                idx = text_lower.find(starter)
-                return text[idx:].strip()
+        # Look for the last sentence ending with a question mark
+        end = text.rfind('?')
+        if end != -1:
+            start = max(
+                text.rfind('.', 0, end),
+                text.rfind('!', 0, end),
+                text.rfind('?', 0, end),
+            ) + 1
+            return text[start:end + 1].strip()
+
+        # Look for question words, extracting from the first one to the end
+        match = self._STARTERS_RE.search(text)
+        if match:
+            return text[match.start():].strip()
 
         # Return the whole text as a potential question
         return text if text else None
@@ -190,14 +194,9 @@ class TextProcessor:
             return True
 
         # Check for question words at the start
-        question_words = [
-            "what", "how", "why", "when", "where", "who", "which",
-            "can", "could", "would", "should", "is", "are", "do", "does",
-            "tell", "explain", "describe", "walk",
-        ]
-
-        first_word = text.split()[0].lower().strip('.,!?;:') if text.split() else ""
-        return first_word in question_words
+        parts = text.split(maxsplit=1)
+        first_word = parts[0].translate(self._PUNCT_TABLE).lower() if parts else ""
+        return first_word in self.QUESTION_WORDS
 
 
 def clean_transcription(text: str) -> str:
@@ -2,7 +2,8 @@
 
 import asyncio
 import threading
-from typing import Callable, Optional, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
 from collections import deque
 from dataclasses import dataclass
 
@@ -14,7 +15,7 @@ from interview_assistant.audio.buffer import AudioRingBuffer
 from .whisper_engine import WhisperEngine, TranscriptionResult
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamingConfig:
     """Configuration for streaming transcription."""
     model_size: str = "base"
@@ -34,6 +35,19 @@ class StreamingTranscriber:
     when speech segments are detected.
     """
 
+    # Chunks allowed in flight on the STT worker before new ones are dropped
+    MAX_PENDING_CHUNKS = 2
+
+    # Capture chunks queued for the VAD worker before the oldest are dropped
+    MAX_QUEUED_CHUNKS = 256
+
+    # Speech chunks decoded per model call when transcribing whole files
+    FILE_BATCH_SIZE = 8
+
+    # Pause length (seconds) that starts a speculative transcription of the
+    # buffer while the endpoint is still pending
+    SPECULATIVE_SILENCE = 0.3
+
     def __init__(self, config: Optional[StreamingConfig] = None):
         """
         Initialize streaming transcriber.
@@ -50,13 +64,46 @@ class StreamingTranscriber:
         )
 
         self._vad = get_vad(use_silero=self.config.use_vad)
-        self._audio_buffer: List[np.ndarray] = []
-        self._silence_duration = 0.0
         self._sample_rate = 16000
 
+        # Preallocated speech buffer; transcription is triggered once it holds
+        # max_audio_length, so it only grows if chunks overshoot that
+        self._audio_buffer = np.empty(
+            int(self.config.max_audio_length * self._sample_rate), dtype=np.int16
+        )
+        self._buffered_samples = 0
+        self._silence_samples = 0
+
         self._event_bus = get_event_bus()
         self._running = False
-        self._lock = threading.Lock()
+        # Reentrant: a speculative pass that is already done runs its
+        # callback inline from add_done_callback, which happens under the lock
+        self._lock = threading.RLock()
+
+        # Dedicated STT worker so transcription never queues behind other
+        # blocking calls on the loop's default executor. It lives as long as
+        # the stt-vad worker: created in start(), shut down when it exits.
+        self._stt_executor: Optional[ThreadPoolExecutor] = None
+        self._stt_pending = 0
+
+        # Capture-thread handoff: process_audio only queues the chunk and
+        # wakes the worker, which runs VAD and transcription. Entries are
+        # (audio, sample_rate, future or None).
+        self._queued_chunks: deque = deque(maxlen=self.MAX_QUEUED_CHUNKS)
+        self._wake = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+        # Guards _running and _worker across start/stop and worker exit
+        self._state_lock = threading.Lock()
+
+        # Speculative pass over the buffer as (sample count, future), and
+        # the state for agreeing partial text between consecutive passes
+        self._speculative: Optional[tuple] = None
+        self._speech_end = 0  # buffered samples up to the last speech frame
+        self._pause_samples = 0  # consecutive non-speech samples
+        self._utterance = 0
+        self._last_speculative_words: list = []
+        self._committed_words = 0
 
         # Callbacks
         self._on_partial: Optional[Callable[[str], None]] = None
@@ -72,84 +119,328 @@ class StreamingTranscriber:
         if not self._engine.load_model():
             return False
 
-        self._running = True
-        self._audio_buffer = []
-        self._silence_duration = 0.0
-        self._vad.reset()
+        with self._state_lock:
+            self._running = True
+
+            # A worker still finishing the previous run keeps going and owns
+            # the state and its queued chunks; otherwise reset it and start
+            # a fresh worker
+            if self._worker is None:
+                self._clear_queue()
+                self._buffered_samples = 0
+                self._silence_samples = 0
+                self._speech_end = 0
+                self._pause_samples = 0
+                self._vad.reset()
+
+                self._stt_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="whisper"
+                )
+                self._worker = threading.Thread(
+                    target=self._consume, name="stt-vad", daemon=True
+                )
+                self._worker.start()
 
         return True
 
     def stop(self) -> None:
-        """Stop the transcriber."""
-        self._running = False
+        """
+        Stop the transcriber.
+
+        Returns immediately. The worker drains the chunks already queued,
+        transcribes whatever speech remains buffered and then exits, so the
+        final result still arrives through TRANSCRIPTION_COMPLETE.
+        """
+        with self._state_lock:
+            self._running = False
+        self._wake.set()
+
+    def process_audio(self, audio: np.ndarray, sample_rate: int = 16000) -> None:
+        """
+        Queue an audio chunk for transcription.
+
+        Called from the audio capture thread, so this only copies the chunk
+        and wakes the worker; it never takes the transcriber lock. Results
+        are delivered through TRANSCRIPTION_COMPLETE and the on_complete
+        callback.
+
+        Args:
+            audio: Audio samples (int16)
+            sample_rate: Sample rate of audio
+        """
+        if not self._running:
+            return
+
+        self._queued_chunks.append((audio.copy(), sample_rate, None))
+        self._wake.set()
+
+    def _consume(self) -> None:
+        """Worker loop: run queued chunks through VAD and transcription."""
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            self._drain_queue()
+
+            if self._running:
+                continue
+
+            # Stopped: everything queued before stop() has been processed,
+            # so transcribe what is left in the buffer
+            with self._lock:
+                if self._buffered_samples:
+                    try:
+                        self._process_buffer()
+                    except Exception as e:
+                        print(f"Error processing audio chunk: {e}")
+
+            with self._state_lock:
+                if self._running:
+                    continue  # Restarted while flushing; keep serving
+                self._worker = None
+                executor, self._stt_executor = self._stt_executor, None
+
+                # Anything queued after the last drain will never be processed
+                self._clear_queue()
+
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            return
 
-        # Process any remaining audio
-        if self._audio_buffer:
-            self._process_buffer()
+    def _clear_queue(self) -> None:
+        """Drop queued chunks, resolving any process_audio_async waiters."""
+        # clear_buffer() can run this while the worker drains, so the deque
+        # may empty between a length check and popleft()
+        while True:
+            try:
+                _, _, future = self._queued_chunks.popleft()
+            except IndexError:
+                break
+            if future is not None and not future.done():
+                future.set_result(None)
+
+    def _drain_queue(self) -> None:
+        """Run every queued chunk through VAD and transcription."""
+        batch = []
+        while True:
+            try:
+                batch.append(self._queued_chunks.popleft())
+            except IndexError:
+                break
+        if not batch:
+            return
 
-    def process_audio(self, audio: np.ndarray, sample_rate: int = 16000) -> Optional[str]:
+        try:
+            # Classify the whole wakeup's worth of chunks at once;
+            # the VAD state machine still advances chunk by chunk
+            flags = self._vad.classify_frames([item[0] for item in batch])
+            for (audio, sample_rate, future), is_speech_frame in zip(batch, flags, strict=True):
+                text = self._process_chunk(audio, sample_rate, is_speech_frame)
+                if future is not None:
+                    future.set_result(text)
+        except Exception as e:
+            print(f"Error processing audio chunk: {e}")
+            for _, _, future in batch:
+                if future is not None and not future.done():
+                    future.set_exception(e)
+
+    def _process_chunk(
+        self,
+        audio: np.ndarray,
+        sample_rate: int,
+        is_speech_frame: Optional[bool] = None,
+    ) -> Optional[str]:
         """
-        Process an audio chunk.
+        Run one chunk through VAD and transcribe on an endpoint.
 
         Args:
             audio: Audio samples (int16)
             sample_rate: Sample rate of audio
+            is_speech_frame: VAD classification of the chunk, if already
+                computed as part of a batch
 
         Returns:
             Transcription text if completed, None otherwise
         """
-        if not self._running:
-            return None
-
         self._sample_rate = sample_rate
 
         # Check VAD
-        is_speech, speech_ended = self._vad.process_frame(audio)
+        if is_speech_frame is None:
+            is_speech_frame = self._vad.classify_frames([audio])[0]
+        is_speech, speech_ended = self._vad.update(is_speech_frame, len(audio))
 
         with self._lock:
             if is_speech:
-                self._audio_buffer.append(audio)
-                self._silence_duration = 0.0
+                self._append_audio(audio)
+                self._silence_samples = 0
 
                 # Emit partial transcription event
                 self._event_bus.emit(Event.TRANSCRIPTION_STARTED)
 
             else:
-                chunk_duration = len(audio) / sample_rate
-                self._silence_duration += chunk_duration
+                self._silence_samples += len(audio)
 
             # Check if we should transcribe
             buffer_duration = self._get_buffer_duration()
+            silence_duration = self._silence_samples / sample_rate
 
             should_transcribe = (
                 (speech_ended and buffer_duration >= self.config.min_audio_length) or
-                (self._silence_duration >= self.config.silence_threshold and buffer_duration >= self.config.min_audio_length) or
+                (silence_duration >= self.config.silence_threshold and buffer_duration >= self.config.min_audio_length) or
                 (buffer_duration >= self.config.max_audio_length)
             )
 
-            if should_transcribe and self._audio_buffer:
+            # Track pauses on the raw per-chunk decision; the VAD state
+            # keeps reporting speech through its hangover
+            if is_speech_frame:
+                self._pause_samples = 0
+                if is_speech:
+                    self._speech_end = self._buffered_samples
+            else:
+                self._pause_samples += len(audio)
+
+            if should_transcribe and self._buffered_samples:
                 return self._process_buffer()
 
+            if (
+                self._pause_samples >= self.SPECULATIVE_SILENCE * sample_rate
+                and self._speech_end >= self.config.min_audio_length * sample_rate
+            ):
+                self._start_speculative()
+
         return None
 
+    def _start_speculative(self) -> None:
+        """Transcribe the speech buffered so far on the STT worker during a pause."""
+        n = self._speech_end
+        if self._speculative is not None and self._speculative[0] == n:
+            return  # Already transcribing exactly this audio
+
+        if self._speculative is not None:
+            self._speculative[1].cancel()
+
+        # Snapshot as float32: the buffer is reused as soon as the endpoint
+        # fires, and float32 input keeps this pass off the engine's scratch
+        # buffer lock, so a stale pass never delays the endpoint's own call
+        audio = np.multiply(self._audio_buffer[:n], np.float32(1.0 / 32768.0), dtype=np.float32)
+        try:
+            future = self._stt_executor.submit(
+                self._engine.transcribe,
+                audio,
+                self._sample_rate,
+                vad_filter=False,
+                with_timestamps=False,
+            )
+        except RuntimeError:
+            return  # Executor shut down
+
+        self._speculative = (n, future)
+        utterance = self._utterance
+        future.add_done_callback(lambda f: self._on_speculative_done(f, utterance))
+
+    def _on_speculative_done(self, future, utterance: int) -> None:
+        """Emit the prefix that two consecutive speculative passes agree on."""
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        result = future.result()
+        if not result:
+            return
+
+        words = result.text.split()
+        text = None
+
+        # Runs on the executor thread; the utterance check and the state
+        # update must not interleave with an endpoint resetting them
+        with self._lock:
+            if utterance != self._utterance:
+                return
+
+            previous = self._last_speculative_words
+            self._last_speculative_words = words
+
+            agreed = 0
+            for a, b in zip(previous, words, strict=False):
+                if a != b:
+                    break
+                agreed += 1
+
+            if agreed > self._committed_words:
+                self._committed_words = agreed
+                text = " ".join(words[:agreed])
+
+        if text is not None:
+            self._event_bus.emit(Event.TRANSCRIPTION_PARTIAL, text)
+            if self._on_partial:
+                self._on_partial(text)
+
+    def _reset_speculative(self) -> Optional[tuple]:
+        """Start a new utterance, returning the pending speculative pass."""
+        speculative = self._speculative
+        self._speculative = None
+        self._utterance += 1
+        self._last_speculative_words = []
+        self._committed_words = 0
+        return speculative
+
+    def _take_speculative(self, speech_end: int) -> Optional[TranscriptionResult]:
+        """Get the speculative result if it covers speech up to speech_end."""
+        speculative = self._reset_speculative()
+        if speculative is None:
+            return None
+
+        spec_samples, future = speculative
+
+        # A pass that has not started yet is cancelled and redone inline,
+        # which also avoids waiting on the executor from its own thread
+        if future.cancel() or spec_samples != speech_end:
+            return None
+
+        # Same audio as the endpoint and already running: wait for it
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def _append_audio(self, audio: np.ndarray) -> None:
+        """Copy a chunk into the speech buffer, growing it if needed."""
+        end = self._buffered_samples + len(audio)
+        if end > len(self._audio_buffer):
+            grown = np.empty(max(end, 2 * len(self._audio_buffer)), dtype=np.int16)
+            grown[:self._buffered_samples] = self._audio_buffer[:self._buffered_samples]
+            self._audio_buffer = grown
+
+        self._audio_buffer[self._buffered_samples:end] = audio
+        self._buffered_samples = end
+
     def _get_buffer_duration(self) -> float:
         """Get duration of audio in buffer."""
-        total_samples = sum(len(chunk) for chunk in self._audio_buffer)
-        return total_samples / self._sample_rate
+        return self._buffered_samples / self._sample_rate
 
     def _process_buffer(self) -> Optional[str]:
         """Process the audio buffer and return transcription."""
-        if not self._audio_buffer:
+        if not self._buffered_samples:
             return None
 
-        # Concatenate audio
-        audio = np.concatenate(self._audio_buffer)
-        self._audio_buffer = []
-        self._silence_duration = 0.0
+        # Transcription runs synchronously under the lock, so the engine can
+        # be handed a view of the buffer that is reused for the next utterance
+        audio = self._audio_buffer[:self._buffered_samples]
+        speech_end = self._speech_end
+        self._buffered_samples = 0
+        self._silence_samples = 0
+        self._speech_end = 0
+        self._pause_samples = 0
         self._vad.reset()
 
-        # Transcribe
-        result = self._engine.transcribe(audio, self._sample_rate)
+        # Reuse a speculative pass if no speech arrived after it started;
+        # it only leaves out the trailing pause
+        result = self._take_speculative(speech_end)
+        if result is None:
+            # Only VAD-gated speech frames reach the buffer, so skip the
+            # engine's second VAD pass over the same audio; only the text is
+            # used, so skip timestamp tokens too
+            result = self._engine.transcribe(
+                audio, self._sample_rate, vad_filter=False, with_timestamps=False
+            )
 
         if result and result.text.strip():
             text = result.text.strip()
@@ -174,15 +465,43 @@ class StreamingTranscriber:
             sample_rate: Sample rate
 
         Returns:
-            Transcription text if completed
+            Transcription text if completed, None if the chunk was dropped
+            because the STT worker is already backed up
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.process_audio,
-            audio,
-            sample_rate,
-        )
+        if not self._running:
+            return None
+
+        # Back-pressure: drop the chunk rather than queue unbounded latency;
+        # a full queue would also silently evict an older chunk's future
+        if (
+            self._stt_pending >= self.MAX_PENDING_CHUNKS
+            or len(self._queued_chunks) >= self.MAX_QUEUED_CHUNKS
+        ):
+            return None
+
+        # Same queue as process_audio, so only the worker touches the VAD
+        future: Future = Future()
+        self._queued_chunks.append((audio.copy(), sample_rate, future))
+        self._wake.set()
+
+        self._stt_pending += 1
+        try:
+            return await asyncio.wrap_future(future)
+        finally:
+            self._stt_pending -= 1
+
+    async def aclose(self) -> None:
+        """
+        Stop the transcriber and wait for its final transcription.
+
+        Optional: stop() alone also shuts the STT executor down, once the
+        worker has flushed.
+        """
+        worker = self._worker
+        self.stop()
+        if worker is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, worker.join)
 
     def transcribe_file(self, audio: np.ndarray, sample_rate: int = 16000) -> Optional[str]:
         """
@@ -198,7 +517,7 @@ class StreamingTranscriber:
         if not self._engine.load_model():
             return None
 
-        result = self._engine.transcribe(audio, sample_rate)
+        result = self._engine.transcribe(audio, sample_rate, batch_size=self.FILE_BATCH_SIZE)
         return result.text if result else None
 
     def set_on_partial(self, callback: Callable[[str], None]) -> None:
@@ -211,9 +530,15 @@ class StreamingTranscriber:
 
     def clear_buffer(self) -> None:
         """Clear the audio buffer."""
+        self._clear_queue()
         with self._lock:
-            self._audio_buffer = []
-            self._silence_duration = 0.0
+            self._buffered_samples = 0
+            self._silence_samples = 0
+            self._speech_end = 0
+            self._pause_samples = 0
+            speculative = self._reset_speculative()
+            if speculative is not None:
+                speculative[1].cancel()
             self._vad.reset()
 
     @property
@@ -224,8 +549,8 @@ class StreamingTranscriber:
     @property
     def buffer_duration(self) -> float:
         """Get current buffer duration in seconds."""
-        with self._lock:
-            return self._get_buffer_duration()
+        # A single int read; safe without the lock, so cheap enough to poll
+        return self._get_buffer_duration()
 
 
 class TranscriptionPipeline:
@@ -250,6 +575,10 @@ class TranscriptionPipeline:
         self._on_transcription = on_transcription
         self._event_bus = get_event_bus()
 
+        # Transcriptions complete on the transcriber's worker thread
+        if on_transcription:
+            self.transcriber.set_on_complete(on_transcription)
+
         # Subscribe to audio events
         self._event_bus.subscribe(Event.AUDIO_CHUNK, self._on_audio_chunk)
 
@@ -258,10 +587,7 @@ class TranscriptionPipeline:
         if not self.transcriber.is_running:
             return
 
-        result = self.transcriber.process_audio(audio)
-
-        if result and self._on_transcription:
-            self._on_transcription(result)
+        self.transcriber.process_audio(audio)
 
     def start(self) -> bool:
         """Start the pipeline."""
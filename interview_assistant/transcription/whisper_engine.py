@@ -1,14 +1,79 @@
 """Whisper model management for transcription."""
 
 import os
+import threading
+from contextlib import nullcontext
+from functools import lru_cache
+from math import gcd
 from pathlib import Path
 from typing import Optional, List, Tuple
 from dataclasses import dataclass
 
 import numpy as np
 
-
-@dataclass
+try:
+    from scipy.signal import firwin, resample_poly
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+
+@lru_cache(maxsize=8)
+def _resample_kernel(up: int, down: int) -> np.ndarray:
+    """Anti-aliasing FIR kernel for resample_poly, designed once per ratio."""
+    # Same design resample_poly uses by default, kept in float32 to match audio
+    max_rate = max(up, down)
+    return firwin(2 * 10 * max_rate + 1, 1.0 / max_rate, window=('kaiser', 5.0)).astype(
+        np.float32
+    )
+
+
+def _resample_to_16k(audio: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Resample float32 audio to 16 kHz."""
+    if SCIPY_AVAILABLE:
+        # Polyphase filtering with a proper low-pass, no aliasing
+        g = gcd(sample_rate, 16000)
+        up, down = 16000 // g, sample_rate // g
+        return resample_poly(audio, up, down, window=_resample_kernel(up, down)).astype(
+            np.float32, copy=False
+        )
+
+    # Fallback: linear interpolation
+    new_length = int(len(audio) * 16000 / sample_rate)
+    indices = np.linspace(0, len(audio) - 1, new_length)
+    return np.interp(indices, np.arange(len(audio)), audio).astype(np.float32)
+
+
+def _preferred_compute_type(device: str) -> str:
+    """Pick the fastest quantized compute type the device supports."""
+    # INT8 weights with FP16 activations use the GPU's int8 tensor cores;
+    # CTranslate2 picks the best CPU kernels (AVX2/AVX-512/VNNI) at runtime
+    preferred = ("int8_float16", "float16") if device == "cuda" else ("int8",)
+    try:
+        import ctranslate2
+        supported = ctranslate2.get_supported_compute_types(device)
+        for compute_type in preferred:
+            if compute_type in supported:
+                return compute_type
+    except Exception:
+        pass
+
+    return "float16" if device == "cuda" else "int8"
+
+
+def _physical_cores() -> int:
+    """Number of physical CPU cores, falling back to logical CPUs."""
+    try:
+        import psutil
+        cores = psutil.cpu_count(logical=False)
+        if cores:
+            return cores
+    except ImportError:
+        pass
+    return os.cpu_count() or 4
+
+
+@dataclass(slots=True, frozen=True)
 class TranscriptionSegment:
     """A transcription segment."""
     text: str
@@ -17,7 +82,7 @@ class TranscriptionSegment:
     confidence: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranscriptionResult:
     """Result of transcription."""
     text: str
@@ -35,12 +100,25 @@ class WhisperEngine:
 
     MODELS = ["tiny", "base", "small", "medium", "large-v2", "large-v3"]
 
+    # Initial size of the conversion scratch buffer (30 s at 16 kHz)
+    SCRATCH_SAMPLES = 30 * 16000
+
+    # Concurrent transcribe() calls the model can serve
+    MODEL_WORKERS = 2
+
+    # faster-whisper VAD options, built once rather than per call
+    VAD_PARAMETERS = {
+        "min_silence_duration_ms": 500,
+        "speech_pad_ms": 200,
+    }
+
     def __init__(
         self,
         model_size: str = "base",
         device: str = "auto",
         compute_type: str = "auto",
         language: str = "en",
+        cpu_threads: int = 0,
     ):
         """
         Initialize Whisper engine.
@@ -48,16 +126,26 @@ class WhisperEngine:
         Args:
             model_size: Model size (tiny, base, small, medium, large-v2, large-v3)
             device: Device to use (auto, cpu, cuda)
-            compute_type: Compute type (auto, int8, float16, float32)
+            compute_type: Compute type (auto, int8, int8_float16, float16, float32)
             language: Language code for transcription
+            cpu_threads: CPU inference threads (0 for one per physical core)
         """
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
         self.language = language
+        self.cpu_threads = cpu_threads
 
         self._model = None
+        self._batched = None
         self._model_path: Optional[Path] = None
+        self._warmed = False
+
+        # Reused float32 buffer for int16 -> float32 conversion; the lock
+        # serializes the transcribe() calls that use it (int16 input).
+        # Float32 callers skip it and can run alongside them.
+        self._fp32_scratch = np.empty(self.SCRATCH_SAMPLES, dtype=np.float32)
+        self._transcribe_lock = threading.Lock()
 
     def _resolve_device(self) -> Tuple[str, str]:
         """Resolve device and compute type."""
@@ -72,10 +160,7 @@ class WhisperEngine:
                 device = "cpu"
 
         if compute_type == "auto":
-            if device == "cuda":
-                compute_type = "float16"
-            else:
-                compute_type = "int8"
+            compute_type = _preferred_compute_type(device)
 
         return device, compute_type
 
@@ -96,13 +181,24 @@ class WhisperEngine:
 
             print(f"Loading Whisper {self.model_size} on {device} ({compute_type})...")
 
+            # Each worker gets its own intra-op thread pool, so on CPU split
+            # the cores between them rather than oversubscribing 2x
+            cpu_threads = self.cpu_threads or _physical_cores()
+            if device == "cpu":
+                cpu_threads = max(1, cpu_threads // self.MODEL_WORKERS)
+
             self._model = WhisperModel(
                 self.model_size,
                 device=device,
                 compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                # Lets a float32 call run alongside an int16 one instead of
+                # queueing inside CTranslate2
+                num_workers=self.MODEL_WORKERS,
             )
 
             print("Whisper model loaded successfully")
+            self._warm_up()
             return True
 
         except ImportError:
@@ -117,6 +213,9 @@ class WhisperEngine:
         audio: np.ndarray,
         sample_rate: int = 16000,
         language: Optional[str] = None,
+        vad_filter: bool = True,
+        batch_size: int = 1,
+        with_timestamps: bool = True,
     ) -> Optional[TranscriptionResult]:
         """
         Transcribe audio.
@@ -125,6 +224,12 @@ class WhisperEngine:
             audio: Audio samples (int16 or float32)
             sample_rate: Sample rate of audio
             language: Language code (None for auto-detect)
+            vad_filter: Strip silence with faster-whisper's VAD first. Callers
+                that already feed speech-only audio can skip this pass.
+            batch_size: Decode up to this many speech chunks per model call
+                (long audio only; needs vad_filter to split the chunks)
+            with_timestamps: Decode segment timestamp tokens. Callers that
+                only use the text can turn this off to shorten decoding.
 
         Returns:
             TranscriptionResult or None on error
@@ -132,55 +237,117 @@ class WhisperEngine:
         if not self.load_model():
             return None
 
+        lock = self._transcribe_lock if audio.dtype == np.int16 else nullcontext()
+        with lock:
+            try:
+                audio = self._prepare_audio(audio, sample_rate)
+
+                # Batched decoding pays off only when there are several chunks
+                model = self._model
+                extra = {}
+                if batch_size > 1 and vad_filter and len(audio) > 30 * 16000:
+                    batched = self._get_batched_pipeline()
+                    if batched is not None:
+                        model = batched
+                        extra["batch_size"] = batch_size
+
+                # Transcribe
+                segments, info = model.transcribe(
+                    audio,
+                    language=language or self.language,
+                    vad_filter=vad_filter,
+                    vad_parameters=self.VAD_PARAMETERS if vad_filter else None,
+                    without_timestamps=not with_timestamps,
+                    **extra,
+                )
+
+                # Convert segments
+                result_segments = []
+                full_text = []
+
+                for segment in segments:
+                    result_segments.append(TranscriptionSegment(
+                        text=segment.text.strip(),
+                        start=segment.start,
+                        end=segment.end,
+                        confidence=segment.avg_logprob if hasattr(segment, 'avg_logprob') else 1.0,
+                    ))
+                    full_text.append(segment.text.strip())
+
+                return TranscriptionResult(
+                    text=" ".join(full_text),
+                    segments=result_segments,
+                    language=info.language if info else self.language,
+                    duration=info.duration if info else len(audio) / 16000,
+                )
+
+            except Exception as e:
+                print(f"Transcription error: {e}")
+                return None
+
+    def _get_batched_pipeline(self):
+        """Get a batched pipeline over the loaded model, if supported."""
+        if self._batched is None:
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                return None  # Needs faster-whisper 1.1+
+            self._batched = BatchedInferencePipeline(model=self._model)
+        return self._batched
+
+    def _warm_up(self) -> None:
+        """
+        Run one throwaway transcription right after loading.
+
+        The first forward pass pays for device/context setup and kernel
+        selection; doing it here keeps that off the first real utterance.
+        """
+        if self._warmed:
+            return
+
         try:
-            # Normalize audio to float32
-            if audio.dtype == np.int16:
-                audio = audio.astype(np.float32) / 32768.0
-            elif audio.dtype != np.float32:
-                audio = audio.astype(np.float32)
-
-            # Resample if needed (Whisper expects 16kHz)
-            if sample_rate != 16000:
-                # Simple resampling - for production use librosa or scipy
-                ratio = 16000 / sample_rate
-                new_length = int(len(audio) * ratio)
-                indices = np.linspace(0, len(audio) - 1, new_length)
-                audio = np.interp(indices, np.arange(len(audio)), audio)
-
-            # Transcribe
-            segments, info = self._model.transcribe(
-                audio,
-                language=language or self.language,
-                vad_filter=True,
-                vad_parameters=dict(
-                    min_silence_duration_ms=500,
-                    speech_pad_ms=200,
-                ),
+            segments, _ = self._model.transcribe(
+                np.zeros(16000, dtype=np.float32),
+                language=self.language,
+                vad_filter=False,
             )
+            # Segments are generated lazily; consume them to run the decoder
+            for _ in segments:
+                pass
+            self._warmed = True
+        except Exception as e:
+            print(f"Whisper warm-up failed: {e}")
 
-            # Convert segments
-            result_segments = []
-            full_text = []
-
-            for segment in segments:
-                result_segments.append(TranscriptionSegment(
-                    text=segment.text.strip(),
-                    start=segment.start,
-                    end=segment.end,
-                    confidence=segment.avg_logprob if hasattr(segment, 'avg_logprob') else 1.0,
-                ))
-                full_text.append(segment.text.strip())
-
-            return TranscriptionResult(
-                text=" ".join(full_text),
-                segments=result_segments,
-                language=info.language if info else self.language,
-                duration=info.duration if info else len(audio) / 16000,
-            )
+    def _prepare_audio(self, audio: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Get mono 16 kHz float32 audio, copying only when conversion is needed."""
+        if audio.ndim != 1:
+            raise ValueError(f"Expected mono 1-D audio, got shape {audio.shape}")
 
-        except Exception as e:
-            print(f"Transcription error: {e}")
-            return None
+        # Already in Whisper's format: hand it over as-is
+        if sample_rate == 16000 and audio.dtype == np.float32 and audio.flags.c_contiguous:
+            return audio
+
+        # Normalize audio to float32
+        if audio.dtype == np.int16:
+            audio = self._int16_to_float32(audio)
+        else:
+            audio = np.ascontiguousarray(audio, dtype=np.float32)
+
+        # Resample if needed (Whisper expects 16kHz)
+        if sample_rate != 16000:
+            audio = _resample_to_16k(audio, sample_rate)
+
+        return audio
+
+    def _int16_to_float32(self, audio: np.ndarray) -> np.ndarray:
+        """Scale int16 samples to [-1, 1) in one pass into the scratch buffer."""
+        n = len(audio)
+        if n > len(self._fp32_scratch):
+            self._fp32_scratch = np.empty(n, dtype=np.float32)
+
+        out = self._fp32_scratch[:n]
+        np.multiply(audio, np.float32(1.0 / 32768.0), out=out, casting='unsafe')
+        return out
 
     def is_loaded(self) -> bool:
         """Check if model is loaded."""
@@ -189,6 +356,8 @@ class WhisperEngine:
     def unload_model(self) -> None:
         """Unload the model to free memory."""
         self._model = None
+        self._batched = None
+        self._warmed = False
 
     @classmethod
     def download_model(cls, model_size: str = "base") -> bool:
@@ -5,8 +5,10 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("GtkSource", "5")
 from gi.repository import Gtk, GtkSource, Gdk, GLib, Pango
 
+from typing import Optional
+
 from interview_assistant.core.events import Event, get_event_bus
-from interview_assistant.ai.response_parser import ResponseParser
+from interview_assistant.ai.response_parser import ParsedResponse, get_response_parser
 
 
 class AnswerView(Gtk.Box):
@@ -16,6 +18,9 @@ class AnswerView(Gtk.Box):
     Supports streaming responses and code block extraction.
     """
 
+    # How often streamed tokens are flushed into the buffer (~one frame)
+    FLUSH_INTERVAL_MS = 16
+
     def __init__(self):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=8)
 
@@ -93,11 +98,19 @@ class AnswerView(Gtk.Box):
 
         self.append(self._status_bar)
 
-        # Response parser
-        self._parser = ResponseParser()
+        # Response parser, and the parse of the current response
+        self._parser = get_response_parser()
+        self._parsed: Optional[ParsedResponse] = None
+
+        # Current response text, kept as chunks and joined on demand
+        self._chunks: list = []
+        self._joined: Optional[str] = ""
 
-        # Current response text
-        self._full_response = ""
+        # Streamed tokens are inserted at most once per frame, and at most
+        # one scroll is queued at a time
+        self._pending_text: list = []
+        self._flush_timer: Optional[int] = None
+        self._scroll_pending = False
 
         # Subscribe to events
         self._event_bus = get_event_bus()
@@ -117,8 +130,13 @@ class AnswerView(Gtk.Box):
 
     def _on_response_complete(self, response) -> None:
         """Handle complete response."""
+        # Insert any tokens still waiting for the flush timer
+        if self._flush_timer is not None:
+            GLib.source_remove(self._flush_timer)
+            self._flush_pending()
+
         # Extract complexity if present
-        complexity = self._parser.extract_complexity(self._full_response)
+        complexity = self._get_parsed().complexity
         if complexity:
             time_comp, space_comp = complexity
             self._complexity_label.set_label(f"Time: {time_comp}  |  Space: {space_comp}")
@@ -135,7 +153,7 @@ class AnswerView(Gtk.Box):
 
     def _detect_and_highlight(self) -> None:
         """Detect code language and apply highlighting."""
-        parsed = self._parser.parse(self._full_response)
+        parsed = self._get_parsed()
 
         if parsed.code_blocks:
             # Get the primary language
@@ -151,13 +169,32 @@ class AnswerView(Gtk.Box):
         Args:
             text: Text token to append
         """
-        self._full_response += text
-
-        end_iter = self._buffer.get_end_iter()
-        self._buffer.insert(end_iter, text)
-
-        # Auto-scroll to bottom
-        self._scroll_to_bottom()
+        self._chunks.append(text)
+        self._joined = None
+        self._parsed = None
+        self._pending_text.append(text)
+
+        if self._flush_timer is None:
+            self._flush_timer = GLib.timeout_add(self.FLUSH_INTERVAL_MS, self._flush_pending)
+
+    def _flush_pending(self) -> bool:
+        """Insert all pending tokens in a single buffer mutation."""
+        self._flush_timer = None
+        if self._pending_text:
+            text = "".join(self._pending_text)
+            self._pending_text.clear()
+            self._buffer.insert(self._buffer.get_end_iter(), text)
+
+            # Auto-scroll to bottom
+            self._scroll_to_bottom()
+        return False
+
+    def _discard_pending(self) -> None:
+        """Drop tokens that have not been inserted yet."""
+        self._pending_text.clear()
+        if self._flush_timer is not None:
+            GLib.source_remove(self._flush_timer)
+            self._flush_timer = None
 
     def set_text(self, text: str) -> None:
         """
@@ -166,29 +203,53 @@ class AnswerView(Gtk.Box):
         Args:
             text: Complete answer text
         """
-        self._full_response = text
+        self._discard_pending()
+        self._chunks = [text]
+        self._joined = text
+        self._parsed = None
         self._buffer.set_text(text)
         self._scroll_to_bottom()
 
+    @property
+    def _full_response(self) -> str:
+        """The full response text, joined once per change."""
+        if self._joined is None:
+            self._joined = "".join(self._chunks)
+        return self._joined
+
+    def _get_parsed(self) -> ParsedResponse:
+        """Parse the current response once per change."""
+        if self._parsed is None:
+            self._parsed = self._parser.parse(self._full_response)
+        return self._parsed
+
     def get_text(self) -> str:
         """Get the current answer text."""
         return self._full_response
 
     def clear(self) -> None:
         """Clear the answer."""
-        self._full_response = ""
+        self._discard_pending()
+        self._chunks = []
+        self._joined = ""
+        self._parsed = None
         self._buffer.set_text("")
         self._buffer.set_language(None)
         self._complexity_label.set_label("")
 
     def _scroll_to_bottom(self) -> None:
         """Scroll to the bottom of the view."""
-        def scroll():
-            adj = self._source_view.get_parent().get_vadjustment()
-            adj.set_value(adj.get_upper() - adj.get_page_size())
-            return False
-
-        GLib.idle_add(scroll)
+        if self._scroll_pending:
+            return
+        self._scroll_pending = True
+        GLib.idle_add(self._do_scroll)
+
+    def _do_scroll(self) -> bool:
+        """Idle callback for _scroll_to_bottom."""
+        self._scroll_pending = False
+        adj = self._source_view.get_parent().get_vadjustment()
+        adj.set_value(adj.get_upper() - adj.get_page_size())
+        return False
 
     def _on_copy_clicked(self, button) -> None:
         """Copy answer to clipboard."""
@@ -205,7 +266,7 @@ class AnswerView(Gtk.Box):
 
     def get_code_blocks(self) -> list:
         """Extract code blocks from the answer."""
-        parsed = self._parser.parse(self._full_response)
+        parsed = self._get_parsed()
         return [(b.language, b.code) for b in parsed.code_blocks]
 
 
@@ -3,13 +3,98 @@
 import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Gtk, Adw, Gdk, GLib
+from gi.repository import Gtk, Adw, Gdk, Gio, GLib, GObject, Pango
 
+import logging
+import threading
 from datetime import datetime
 from typing import List, Optional
 
 from interview_assistant.core.events import Event, get_event_bus
 from interview_assistant.core.session import QAPair
+from .styles import ensure_styles_loaded
+
+logger = logging.getLogger(__name__)
+
+
+class QAItem(GObject.Object):
+    """GObject wrapper so a QAPair can be held in a Gio.ListModel."""
+
+    __gtype_name__ = "InterviewAssistantQAItem"
+
+    def __init__(self, qa: QAPair):
+        super().__init__()
+        self.qa = qa
+
+        # Lowercased once on ingest so search never re-lowercases per keystroke
+        self.question_lower = qa.question.lower()
+        self.answer_lower = qa.answer.lower()
+
+        # Row labels, computed once so binding a recycled row does no string work
+        self.preview = qa.question[:50] + "..." if len(qa.question) > 50 else qa.question
+        self.type_upper = qa.interview_type.value.upper()
+        self.type_class = qa.interview_type.value.replace("_", "-")
+
+        # Timestamps formatted once, for the row and for export
+        self.time_short = qa.timestamp.strftime("%H:%M:%S")
+        self.time_long = qa.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+
+
+class QAHistoryModel(GObject.Object, Gio.ListModel):
+    """
+    List model over a Q&A history, most recent first.
+
+    QAItem wrappers are created only when an item is first requested, so
+    opening the dialog on a long history costs nothing per entry until the
+    list view, a search, or an export actually reaches it.
+    """
+
+    __gtype_name__ = "InterviewAssistantQAHistoryModel"
+
+    def __init__(self):
+        super().__init__()
+        self._history: List[QAPair] = []
+        self._items: List[Optional[QAItem]] = []  # By history index
+
+    def do_get_item_type(self):
+        return QAItem.__gtype__
+
+    def do_get_n_items(self) -> int:
+        return len(self._items)
+
+    def do_get_item(self, position: int) -> Optional[QAItem]:
+        n = len(self._items)
+        if position >= n:
+            return None
+
+        index = n - 1 - position
+        item = self._items[index]
+        if item is None:
+            item = self._items[index] = QAItem(self._history[index])
+        return item
+
+    def set_history(self, history: List[QAPair]) -> None:
+        """
+        Show a history, oldest entry first.
+
+        When the history only grew since the last call, just the new
+        entries are announced; anything else replaces the whole list.
+
+        Args:
+            history: Q&A pairs in the order they were asked
+        """
+        old_n = len(self._items)
+        new_n = len(history)
+
+        if 0 < old_n <= new_n and history[old_n - 1] is self._history[old_n - 1]:
+            self._history = history
+            self._items.extend([None] * (new_n - old_n))
+            if new_n > old_n:
+                self.items_changed(0, 0, new_n - old_n)
+        else:
+            self._history = history
+            self._items = [None] * new_n
+            self.items_changed(0, old_n, new_n)
 
 
 class HistoryDialog(Adw.Window):
@@ -19,7 +104,18 @@ class HistoryDialog(Adw.Window):
     Allows browsing, searching, and exporting past questions and answers.
     """
 
-    def __init__(self, parent: Gtk.Window):
+    # Delay before search-changed fires after the last keystroke
+    SEARCH_DELAY_MS = 200
+
+    def __init__(self, parent: Gtk.Window, history: Optional[List[QAPair]] = None):
+        """
+        Initialize the dialog.
+
+        Args:
+            parent: Window the dialog is attached to
+            history: Q&A pairs already in the session, oldest first; later
+                ones arrive through HISTORY_ITEM_ADDED
+        """
         super().__init__()
 
         self.set_transient_for(parent)
@@ -27,12 +123,21 @@ class HistoryDialog(Adw.Window):
         self.set_title("History")
         self.set_default_size(700, 500)
 
+        ensure_styles_loaded()
+
         self._event_bus = get_event_bus()
         self._history: List[QAPair] = []
+        self._query = ""
+
+        # Resolved once; both copy buttons reuse it
+        self._clipboard = Gdk.Display.get_default().get_clipboard()
 
         self._build_ui()
         self._connect_events()
 
+        if history:
+            self.set_history(list(history))
+
     def _build_ui(self) -> None:
         """Build the history UI."""
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
@@ -66,6 +171,8 @@ class HistoryDialog(Adw.Window):
         self._search_bar = Gtk.SearchBar()
         self._search_entry = Gtk.SearchEntry()
         self._search_entry.set_hexpand(True)
+        # Coalesce keystrokes so the filter runs once per typing pause
+        self._search_entry.set_search_delay(self.SEARCH_DELAY_MS)
         self._search_entry.connect("search-changed", self._on_search_changed)
         self._search_bar.set_child(self._search_entry)
         main_box.append(self._search_bar)
@@ -77,13 +184,28 @@ class HistoryDialog(Adw.Window):
         list_box_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         list_box_container.set_size_request(250, -1)
 
-        self._list_box = Gtk.ListBox()
-        self._list_box.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self._list_box.connect("row-selected", self._on_row_selected)
-        self._list_box.add_css_class("glass-surface")
+        # Rows are recycled by the factory, so only the visible ones exist
+        self._store = QAHistoryModel()
+
+        # Search filters the store in place instead of rebuilding it
+        self._filter = Gtk.CustomFilter.new(self._match_item)
+        self._filter_model = Gtk.FilterListModel.new(self._store, self._filter)
+
+        self._selection = Gtk.SingleSelection(model=self._filter_model)
+        self._selection.set_autoselect(False)
+        self._selection.set_can_unselect(True)
+        self._selection.connect("notify::selected-item", self._on_selection_changed)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_row_setup)
+        factory.connect("bind", self._on_row_bind)
+        factory.connect("unbind", self._on_row_unbind)
+
+        self._list_view = Gtk.ListView(model=self._selection, factory=factory)
+        self._list_view.add_css_class("glass-surface")
 
         list_scroll = Gtk.ScrolledWindow()
-        list_scroll.set_child(self._list_box)
+        list_scroll.set_child(self._list_view)
         list_scroll.set_vexpand(True)
         list_box_container.append(list_scroll)
 
@@ -150,68 +272,109 @@ class HistoryDialog(Adw.Window):
 
     def _connect_events(self) -> None:
         """Connect to events."""
-        self._event_bus.subscribe(Event.HISTORY_UPDATED, self._on_history_updated)
+        # Handlers are kept so cleanup() can unsubscribe the same objects
+        self._handlers = {
+            Event.HISTORY_UPDATED: self._on_history_updated,
+            Event.HISTORY_ITEM_ADDED: self.add_qa,
+            Event.HISTORY_CLEARED: self._on_history_cleared,
+        }
+        self._event_bus.subscribe_many(self._handlers)
+
+        # A closed dialog must stop receiving history events
+        self.connect("close-request", self._on_close_request)
+        self.connect("destroy", lambda _window: self.cleanup())
+
+    def _on_close_request(self, window) -> bool:
+        """Unsubscribe before the dialog closes."""
+        self.cleanup()
+        return False
+
+    def cleanup(self) -> None:
+        """Unsubscribe from events."""
+        for event, handler in self._handlers.items():
+            self._event_bus.unsubscribe(event, handler)
+        self._handlers = {}
 
     def _on_history_updated(self, history: List[QAPair]) -> None:
-        """Handle history update."""
+        """Handle a full history replacement."""
         self._history = history
         self._refresh_list()
 
+    def _on_history_cleared(self, _data=None) -> None:
+        """Handle history being cleared."""
+        if not self._history:
+            return
+        self._history = []
+        self._refresh_list()
+        self._question_view.get_buffer().set_text("")
+        self._answer_view.get_buffer().set_text("")
+
     def _refresh_list(self) -> None:
         """Refresh the list of Q&A items."""
-        # Clear existing items
-        while True:
-            row = self._list_box.get_row_at_index(0)
-            if row:
-                self._list_box.remove(row)
-            else:
-                break
-
-        # Add items
-        for qa in reversed(self._history):  # Most recent first
-            row = self._create_list_row(qa)
-            self._list_box.append(row)
-
-    def _create_list_row(self, qa: QAPair) -> Gtk.ListBoxRow:
-        """Create a list row for a Q&A pair."""
-        row = Gtk.ListBoxRow()
+        self._store.set_history(self._history)
+
+    def _on_row_setup(self, factory, list_item: Gtk.ListItem) -> None:
+        """Build a row template; it is reused for whichever item it shows."""
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
         box.set_margin_top(8)
         box.set_margin_bottom(8)
         box.set_margin_start(8)
         box.set_margin_end(8)
 
-        # Question preview
-        preview = qa.question[:50] + "..." if len(qa.question) > 50 else qa.question
-        q_label = Gtk.Label(label=preview)
+        # Question preview, kept to one line so every row has the same height
+        q_label = Gtk.Label()
         q_label.set_halign(Gtk.Align.START)
-        q_label.set_wrap(True)
+        q_label.set_xalign(0)
+        q_label.set_single_line_mode(True)
+        q_label.set_ellipsize(Pango.EllipsizeMode.END)
         q_label.add_css_class("transcript-text")
         box.append(q_label)
 
         # Timestamp and type
         meta_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
 
-        time_label = Gtk.Label(label=qa.timestamp.strftime("%H:%M:%S"))
+        time_label = Gtk.Label()
         time_label.add_css_class("text-muted")
         meta_box.append(time_label)
 
-        type_label = Gtk.Label(label=qa.interview_type.value.upper())
+        type_label = Gtk.Label()
         type_label.add_css_class("badge")
-        type_label.add_css_class(qa.interview_type.value.replace("_", "-"))
         meta_box.append(type_label)
 
         box.append(meta_box)
 
-        row.set_child(box)
-        row._qa_data = qa  # Store reference
+        # Store references for bind/unbind
+        box._q_label = q_label
+        box._time_label = time_label
+        box._type_label = type_label
+        box._type_class = None
+
+        list_item.set_child(box)
+
+    def _on_row_bind(self, factory, list_item: Gtk.ListItem) -> None:
+        """Fill a recycled row with its Q&A pair."""
+        box = list_item.get_child()
+        item = list_item.get_item()
+
+        box._q_label.set_label(item.preview)
+        box._time_label.set_label(item.time_short)
+        box._type_label.set_label(item.type_upper)
+
+        box._type_class = item.type_class
+        box._type_label.add_css_class(box._type_class)
 
-        return row
+    def _on_row_unbind(self, factory, list_item: Gtk.ListItem) -> None:
+        """Drop per-item styling before the row is recycled."""
+        box = list_item.get_child()
+        if box._type_class:
+            box._type_label.remove_css_class(box._type_class)
+            box._type_class = None
 
-    def _on_row_selected(self, list_box, row) -> None:
+    def _on_selection_changed(self, selection, _pspec) -> None:
         """Handle row selection."""
-        if row and hasattr(row, '_qa_data'):
-            qa = row._qa_data
+        item = selection.get_selected_item()
+        if item is not None:
+            qa = item.qa
             self._question_view.get_buffer().set_text(qa.question)
             self._answer_view.get_buffer().set_text(qa.answer)
 
@@ -223,28 +386,26 @@ class HistoryDialog(Adw.Window):
 
     def _on_search_changed(self, entry) -> None:
         """Handle search text change."""
-        query = entry.get_text().lower()
-        if not query:
-            self._refresh_list()
+        old_query = self._query
+        self._query = entry.get_text().lower()
+        if self._query == old_query:
             return
 
-        # Filter history
-        filtered = [
-            qa for qa in self._history
-            if query in qa.question.lower() or query in qa.answer.lower()
-        ]
-
-        # Update list
-        while True:
-            row = self._list_box.get_row_at_index(0)
-            if row:
-                self._list_box.remove(row)
-            else:
-                break
-
-        for qa in reversed(filtered):
-            row = self._create_list_row(qa)
-            self._list_box.append(row)
+        # Tell GTK how the match set changed so it can skip rows whose
+        # result cannot have changed
+        if old_query in self._query:
+            change = Gtk.FilterChange.MORE_STRICT
+        elif self._query in old_query:
+            change = Gtk.FilterChange.LESS_STRICT
+        else:
+            change = Gtk.FilterChange.DIFFERENT
+        self._filter.changed(change)
+
+    def _match_item(self, item: QAItem) -> bool:
+        """Filter predicate for the current search query."""
+        if not self._query:
+            return True
+        return self._query in item.question_lower or self._query in item.answer_lower
 
     def _on_export_clicked(self, button) -> None:
         """Handle export button click."""
@@ -260,23 +421,42 @@ class HistoryDialog(Adw.Window):
             file = dialog.save_finish(result)
             if file:
                 path = file.get_path()
-                self._export_to_file(path)
-        except Exception as e:
-            print(f"Export error: {e}")
 
-    def _export_to_file(self, path: str) -> None:
-        """Export history to file."""
-        content = "# Interview History\n\n"
+                # Write off the main thread from a snapshot of the items,
+                # oldest first (the store holds them most recent first)
+                n = self._store.get_n_items()
+                items = [self._store.get_item(i) for i in range(n - 1, -1, -1)]
+                threading.Thread(
+                    target=self._export_to_file,
+                    args=(path, items),
+                    daemon=True,
+                ).start()
+        except Exception as e:
+            logger.warning("Export error: %s", e)
 
-        for qa in self._history:
-            content += f"## {qa.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n"
-            content += f"**Type:** {qa.interview_type.value}\n\n"
-            content += f"### Question\n{qa.question}\n\n"
-            content += f"### Answer\n{qa.answer}\n\n"
-            content += "---\n\n"
+    def _export_to_file(self, path: str, items: List[QAItem]) -> None:
+        """Export history to file (runs on a worker thread)."""
+        try:
+            self._write_export(path, items)
+        except Exception as e:
+            logger.warning("Export error: %s", e)
 
+    @staticmethod
+    def _write_export(path: str, items: List[QAItem]) -> None:
+        """Write history to a Markdown file."""
+        # Write entry by entry rather than building the whole document
         with open(path, 'w') as f:
-            f.write(content)
+            f.write("# Interview History\n\n")
+
+            for item in items:
+                qa = item.qa
+                f.write(
+                    f"## {item.time_long}\n"
+                    f"**Type:** {qa.interview_type.value}\n\n"
+                    f"### Question\n{qa.question}\n\n"
+                    f"### Answer\n{qa.answer}\n\n"
+                    "---\n\n"
+                )
 
     def _on_clear_clicked(self, button) -> None:
         """Handle clear button click."""
@@ -294,10 +474,7 @@ class HistoryDialog(Adw.Window):
     def _on_clear_response(self, dialog, response) -> None:
         """Handle clear confirmation response."""
         if response == "clear":
-            self._history = []
-            self._refresh_list()
-            self._question_view.get_buffer().set_text("")
-            self._answer_view.get_buffer().set_text("")
+            self._on_history_cleared()
             self._event_bus.emit(Event.HISTORY_CLEARED)
 
     def _on_copy_question(self, button) -> None:
@@ -306,8 +483,7 @@ class HistoryDialog(Adw.Window):
         start, end = buffer.get_bounds()
         text = buffer.get_text(start, end, True)
 
-        clipboard = Gdk.Display.get_default().get_clipboard()
-        clipboard.set(text)
+        self._clipboard.set(text)
 
     def _on_copy_answer(self, button) -> None:
         """Copy answer to clipboard."""
@@ -315,8 +491,7 @@ class HistoryDialog(Adw.Window):
         start, end = buffer.get_bounds()
         text = buffer.get_text(start, end, True)
 
-        clipboard = Gdk.Display.get_default().get_clipboard()
-        clipboard.set(text)
+        self._clipboard.set(text)
 
     def add_qa(self, qa: QAPair) -> None:
         """Add a Q&A pair to history."""
@@ -5,9 +5,10 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 from gi.repository import Gtk, Adw, Gdk, GLib, Gio
 
-from pathlib import Path
 import asyncio
+import logging
 import threading
+import time
 
 from interview_assistant.core.config import get_config
 from interview_assistant.core.events import Event, get_event_bus
@@ -19,6 +20,7 @@ from interview_assistant.ai.prompts import InterviewType as AIInterviewType
 
 from .transcript_view import TranscriptView
 from .answer_view import AnswerView
+from .styles import ensure_styles_loaded
 from .widgets.audio_level import AudioLevelBar
 from .widgets.status_indicator import StatusIndicator, RecordButton
 from .widgets.mode_selector import ModeSelector
@@ -26,12 +28,17 @@ from .widgets.mode_selector import ModeSelector
 from interview_assistant.stealth.x11_bypass import X11StealthWindow, is_x11_session
 from interview_assistant.core.config import StealthMode
 
+logger = logging.getLogger(__name__)
+
 
 class MainWindow(Adw.ApplicationWindow):
     """
     Main application window with glassmorphism theme.
     """
 
+    # How long a successful AI backend check is trusted, in seconds
+    BACKEND_CHECK_TTL = 30.0
+
     def __init__(self, app):
         super().__init__(application=app)
 
@@ -45,22 +52,26 @@ class MainWindow(Adw.ApplicationWindow):
         self._transcriber = None
         self._ai_assistant = None
 
-        # Async event loop for AI calls
+        # Async event loop for AI calls; questions are answered in order by
+        # one long-running worker task
         self._loop = None
         self._loop_thread = None
+        self._ai_queue = None
+        self._ai_worker = None
+        self._backend_ok_until = 0.0
 
         # Stealth mode
         self._stealth_window = None
 
         # Set up window
         self._setup_window()
-        self._load_styles()
+        ensure_styles_loaded()
         self._build_ui()
         self._connect_events()
         self._start_async_loop()
 
-        # Apply stealth mode after window is shown
-        self.connect("realize", self._on_window_realize)
+        # Apply stealth mode once the window is first shown
+        self._map_handler = self.connect("map", self._on_window_map)
 
     def _setup_window(self) -> None:
         """Configure window properties."""
@@ -73,28 +84,6 @@ class MainWindow(Adw.ApplicationWindow):
         # Set minimum size
         self.set_size_request(600, 400)
 
-    def _load_styles(self) -> None:
-        """Load CSS styles."""
-        css_provider = Gtk.CssProvider()
-
-        # Try to load from package resources
-        css_paths = [
-            Path(__file__).parent.parent / "resources" / "styles" / "glassmorphism.css",
-            Path.home() / ".config" / "interview-assistant" / "styles" / "custom.css",
-        ]
-
-        for css_path in css_paths:
-            if css_path.exists():
-                try:
-                    css_provider.load_from_path(str(css_path))
-                    Gtk.StyleContext.add_provider_for_display(
-                        Gdk.Display.get_default(),
-                        css_provider,
-                        Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-                    )
-                except Exception as e:
-                    print(f"Error loading CSS from {css_path}: {e}")
-
     def _build_ui(self) -> None:
         """Build the main UI layout."""
         # Main container
@@ -224,13 +213,16 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _connect_events(self) -> None:
         """Connect to application events."""
-        self._event_bus.subscribe(Event.TRANSCRIPTION_COMPLETE, self._on_transcription_complete)
-        self._event_bus.subscribe(Event.AI_ERROR, self._on_ai_error)
-        self._event_bus.subscribe(Event.WINDOW_VISIBILITY_CHANGED, self._on_toggle_visibility)
+        self._event_bus.subscribe_many({
+            Event.TRANSCRIPTION_COMPLETE: self._on_transcription_complete,
+            Event.AI_ERROR: self._on_ai_error,
+            Event.WINDOW_VISIBILITY_CHANGED: self._on_toggle_visibility,
+        })
 
-    def _on_toggle_visibility(self) -> None:
+    def _on_toggle_visibility(self, _data=None) -> None:
         """Toggle window visibility (for hotkey)."""
-        GLib.idle_add(self._toggle_visibility)
+        # The event bus already delivers this on the main thread
+        self._toggle_visibility()
 
     def _toggle_visibility(self) -> None:
         """Toggle window visibility on main thread."""
@@ -239,9 +231,12 @@ class MainWindow(Adw.ApplicationWindow):
         else:
             self.present()
 
-    def _on_window_realize(self, widget) -> None:
-        """Apply stealth mode after window is realized."""
-        GLib.timeout_add(500, self._apply_stealth_mode)
+    def _on_window_map(self, widget) -> None:
+        """Apply stealth mode after the window is first mapped."""
+        # Only the first map; HOTKEY_POPUP hides the window and later shows
+        # must not re-apply it
+        self.disconnect(self._map_handler)
+        GLib.idle_add(self._apply_stealth_mode)
 
     def _apply_stealth_mode(self) -> bool:
         """Apply stealth mode based on config."""
@@ -251,23 +246,23 @@ class MainWindow(Adw.ApplicationWindow):
             return False
 
         if not is_x11_session():
-            print("Stealth modes work best on X11. Wayland has limited support.")
+            logger.warning("Stealth modes work best on X11. Wayland has limited support.")
             return False
 
         if self._stealth_window is None:
             self._stealth_window = X11StealthWindow(self)
 
         if not self._stealth_window.is_available:
-            print("X11 stealth features not available (python-xlib may be missing)")
+            logger.warning("X11 stealth features not available (python-xlib may be missing)")
             return False
 
         if stealth_mode == StealthMode.OVERLAY:
             # Try popup window type - sometimes bypasses capture
-            success = self._stealth_window.apply_stealth_mode('popup')
+            success = self._stealth_window.apply_profile(
+                'popup', skip_taskbar=True, on_top=True
+            )
             if success:
-                self._stealth_window.set_skip_taskbar(True)
-                self._stealth_window.set_always_on_top(True)
-                print("Stealth mode: OVERLAY (popup window type)")
+                logger.info("Stealth mode: OVERLAY (popup window type)")
             return False
 
         elif stealth_mode == StealthMode.SECONDARY_MONITOR:
@@ -278,7 +273,7 @@ class MainWindow(Adw.ApplicationWindow):
         elif stealth_mode == StealthMode.HOTKEY_POPUP:
             # Hide window initially, show on hotkey
             self.hide()
-            print("Stealth mode: HOTKEY_POPUP (press Ctrl+Alt+I to show)")
+            logger.info("Stealth mode: HOTKEY_POPUP (press Ctrl+Alt+I to show)")
             return False
 
         return False
@@ -291,7 +286,7 @@ class MainWindow(Adw.ApplicationWindow):
 
         monitors = display.get_monitors()
         if monitors.get_n_items() < 2:
-            print("Secondary monitor mode requires 2+ monitors")
+            logger.warning("Secondary monitor mode requires 2+ monitors")
             return
 
         # Get second monitor
@@ -301,14 +296,17 @@ class MainWindow(Adw.ApplicationWindow):
             # Move window to second monitor
             # Note: GTK4 doesn't allow direct positioning on Wayland
             # This works best on X11
-            print(f"Moving to secondary monitor at ({geometry.x}, {geometry.y})")
+            logger.debug("Moving to secondary monitor at (%d, %d)", geometry.x, geometry.y)
 
     def _start_async_loop(self) -> None:
         """Start the async event loop in a background thread."""
         def run_loop():
-            self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
-            self._loop.run_forever()
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            self._ai_queue = asyncio.Queue()
+            self._ai_worker = loop.create_task(self._answer_worker())
+            self._loop = loop
+            loop.run_forever()
 
         self._loop_thread = threading.Thread(target=run_loop, daemon=True)
         self._loop_thread.start()
@@ -334,11 +332,11 @@ class MainWindow(Adw.ApplicationWindow):
                 if self._loop:
                     async def warmup():
                         try:
-                            print("Warming up AI model...")
+                            logger.debug("Warming up AI model...")
                             await self._ai_assistant.warmup()
-                            print("AI model ready")
+                            logger.info("AI model ready")
                         except Exception as e:
-                            print(f"Warmup failed: {e}")
+                            logger.warning("Warmup failed: %s", e)
                     asyncio.run_coroutine_threadsafe(warmup(), self._loop)
 
             # Initialize audio capture
@@ -388,7 +386,7 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _auto_hide_for_stealth(self) -> bool:
         """Auto-hide window for stealth mode."""
-        print("Auto-hiding window - view answers on your phone!")
+        logger.info("Auto-hiding window - view answers on your phone!")
         self.hide()
         return False  # Don't repeat
 
@@ -426,30 +424,39 @@ class MainWindow(Adw.ApplicationWindow):
         # Get AI answer asynchronously
         self._status_indicator.set_state(StatusIndicator.State.PROCESSING)
 
-        async def get_answer():
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._ai_queue.put_nowait, text)
+
+    async def _answer_worker(self) -> None:
+        """Answer queued questions one at a time (runs on the async loop)."""
+        while True:
+            text = await self._ai_queue.get()
             try:
-                if not self._ai_assistant:
-                    self._ai_assistant = get_ai_assistant()
-
-                # Check if backend is available
-                is_available, message = await self._ai_assistant.check_backend_available()
-                if not is_available:
-                    GLib.idle_add(self._show_error, f"AI Backend Error: {message}")
-                    GLib.idle_add(self._status_indicator.set_state, StatusIndicator.State.ERROR)
-                    return
-
-                mode = self._mode_selector.get_mode()
-                interview_type = AIInterviewType(mode.value) if hasattr(mode, 'value') else AIInterviewType.DSA
-
-                await self._ai_assistant.get_answer(
-                    text,
-                    interview_type=interview_type,
-                )
+                await self._get_answer(text)
             except Exception as e:
                 GLib.idle_add(self._show_error, f"AI Error: {e}")
 
-        if self._loop:
-            asyncio.run_coroutine_threadsafe(get_answer(), self._loop)
+    async def _get_answer(self, text: str) -> None:
+        """Get an AI answer for a transcribed question."""
+        if not self._ai_assistant:
+            self._ai_assistant = get_ai_assistant()
+
+        # Check if backend is available, trusting a recent success
+        if time.monotonic() >= self._backend_ok_until:
+            is_available, message = await self._ai_assistant.check_backend_available()
+            if not is_available:
+                GLib.idle_add(self._show_error, f"AI Backend Error: {message}")
+                GLib.idle_add(self._status_indicator.set_state, StatusIndicator.State.ERROR)
+                return
+            self._backend_ok_until = time.monotonic() + self.BACKEND_CHECK_TTL
+
+        mode = self._mode_selector.get_mode()
+        interview_type = AIInterviewType(mode.value) if hasattr(mode, 'value') else AIInterviewType.DSA
+
+        await self._ai_assistant.get_answer(
+            text,
+            interview_type=interview_type,
+        )
 
     def _on_ai_error(self, error_msg: str) -> None:
         """Handle AI error."""
@@ -466,6 +473,11 @@ class MainWindow(Adw.ApplicationWindow):
         dialog.add_response("ok", "OK")
         dialog.present()
 
+    def get_history(self) -> list:
+        """Get a snapshot of the current session's Q&A pairs, oldest first."""
+        session = self._session_manager.current_session
+        return list(session.qa_pairs) if session else []
+
     def cleanup(self) -> None:
         """Clean up resources."""
         if self._audio_capture:
@@ -3,7 +3,7 @@
 import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Gtk, Adw, Gdk, GLib
+from gi.repository import Gtk, Adw, GLib
 
 from typing import Optional
 
@@ -39,8 +39,12 @@ class OverlayWindow(Gtk.Window):
         self._display_manager = DisplayManager()
         self._popup_mode: Optional[AnswerPopup] = None
 
-        # Current stealth mode
+        # Current stealth mode, and the settings it was last applied with so
+        # repeated requests skip the X11 round-trips
         self._stealth_mode = self._config.stealth.mode
+        self._popup_streamed = False
+        self._last_applied = None
+        self._apply_pending = False
 
         self._setup_window()
         self._build_ui()
@@ -59,17 +63,8 @@ class OverlayWindow(Gtk.Window):
         # Make window transparent
         self.add_css_class("overlay-mode")
 
-        # Set opacity
-        # Note: GTK4 uses CSS for opacity
-        opacity = self._config.stealth.opacity
-        css = f"window {{ opacity: {opacity}; }}"
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(css.encode())
-        Gtk.StyleContext.add_provider_for_display(
-            Gdk.Display.get_default(),
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION + 1
-        )
+        # Set opacity on this window directly; no CSS provider needed
+        self.set_opacity(self._config.stealth.opacity)
 
     def _build_ui(self) -> None:
         """Build the overlay UI."""
@@ -104,7 +99,10 @@ class OverlayWindow(Gtk.Window):
         close_btn.connect("clicked", lambda _: self.hide())
         header.append(close_btn)
 
-        main_box.append(header)
+        # Dragging the header moves the window; GTK handles the move itself
+        handle = Gtk.WindowHandle()
+        handle.set_child(header)
+        main_box.append(handle)
 
         # Answer view
         self._answer_view = AnswerView()
@@ -113,27 +111,27 @@ class OverlayWindow(Gtk.Window):
 
         self.set_child(main_box)
 
-        # Make window draggable
-        gesture = Gtk.GestureDrag()
-        gesture.connect("drag-begin", self._on_drag_begin)
-        gesture.connect("drag-update", self._on_drag_update)
-        header.add_controller(gesture)
+    def _queue_stealth_mode(self) -> None:
+        """Apply the stealth mode once the current burst of changes settles."""
+        if not self._apply_pending:
+            self._apply_pending = True
+            GLib.idle_add(self._apply_stealth_mode_deferred)
 
-    def _on_drag_begin(self, gesture, x, y) -> None:
-        """Handle drag start."""
-        self._drag_start_x = x
-        self._drag_start_y = y
-
-    def _on_drag_update(self, gesture, offset_x, offset_y) -> None:
-        """Handle drag update."""
-        # Note: GTK4 has limited window moving API
-        # This is a simplified implementation
-        pass
+    def _apply_stealth_mode_deferred(self) -> bool:
+        """Idle callback for _queue_stealth_mode."""
+        self._apply_pending = False
+        self._apply_stealth_mode()
+        return False
 
     def _apply_stealth_mode(self) -> None:
         """Apply the current stealth mode."""
         mode = self._stealth_mode
 
+        key = (mode, self._config.stealth.always_on_top, self._config.stealth.opacity)
+        if key == self._last_applied:
+            return
+        self._last_applied = key
+
         # Update mode label
         mode_names = {
             StealthMode.NORMAL: "Normal",
@@ -181,26 +179,50 @@ class OverlayWindow(Gtk.Window):
 
     def _apply_popup_mode(self) -> None:
         """Apply popup mode (auto-hiding)."""
+        # Hide main overlay, use popup instead; the popup window itself is
+        # only built once there is something to show in it
+        if self.get_visible():
+            self.hide()
+
+    def _get_popup(self) -> AnswerPopup:
+        """Get the answer popup, creating it on first use."""
         if not self._popup_mode:
             self._popup_mode = AnswerPopup()
-
-        # Hide main overlay, use popup instead
-        self.hide()
+        return self._popup_mode
 
     def _connect_events(self) -> None:
         """Connect to events."""
-        self._event_bus.subscribe(Event.STEALTH_MODE_CHANGED, self._on_mode_changed)
-        self._event_bus.subscribe(Event.AI_RESPONSE_COMPLETE, self._on_answer_complete)
+        self._event_bus.subscribe_many({
+            Event.STEALTH_MODE_CHANGED: self._on_mode_changed,
+            Event.AI_REQUEST_STARTED: self._on_answer_started,
+            Event.AI_TOKEN_RECEIVED: self._on_answer_token,
+            Event.AI_RESPONSE_COMPLETE: self._on_answer_complete,
+        })
 
     def _on_mode_changed(self, mode: StealthMode) -> None:
         """Handle stealth mode change."""
         self._stealth_mode = mode
-        self._apply_stealth_mode()
+        self._queue_stealth_mode()
+
+    def _on_answer_started(self, question: str) -> None:
+        """Handle a new AI request."""
+        self._popup_streamed = False
+        if self._popup_mode:
+            self._popup_mode.clear()
+
+    def _on_answer_token(self, token: str) -> None:
+        """Stream a token into the popup (the answer view streams itself)."""
+        if self._stealth_mode == StealthMode.HOTKEY_POPUP:
+            self._get_popup().append_answer(token)
+            self._popup_streamed = True
 
     def _on_answer_complete(self, response) -> None:
         """Handle AI answer completion."""
-        if self._stealth_mode == StealthMode.HOTKEY_POPUP and self._popup_mode:
-            self._popup_mode.set_answer(response if isinstance(response, str) else str(response))
+        if self._stealth_mode == StealthMode.HOTKEY_POPUP:
+            self._get_popup()
+            # Only fall back to the full text if the tokens were not streamed
+            if not self._popup_streamed:
+                self._popup_mode.set_answer(response if isinstance(response, str) else str(response))
             self._popup_mode.show()
 
     def set_stealth_mode(self, mode: StealthMode) -> None:
@@ -211,7 +233,7 @@ class OverlayWindow(Gtk.Window):
             mode: New stealth mode
         """
         self._stealth_mode = mode
-        self._apply_stealth_mode()
+        self._queue_stealth_mode()
         self._event_bus.emit(Event.STEALTH_MODE_CHANGED, mode)
 
     def show_answer(self, text: str) -> None:
@@ -222,18 +244,19 @@ class OverlayWindow(Gtk.Window):
             text: Answer text to display
         """
         if self._stealth_mode == StealthMode.HOTKEY_POPUP:
-            if self._popup_mode:
-                self._popup_mode.set_answer(text)
-                self._popup_mode.show()
+            popup = self._get_popup()
+            popup.set_answer(text)
+            popup.show()
         else:
             self._answer_view.set_text(text)
-            self.present()
+            # Raising an already visible window is a window-manager round-trip
+            if not self.get_visible():
+                self.present()
 
     def toggle_visibility(self) -> None:
         """Toggle overlay visibility."""
         if self._stealth_mode == StealthMode.HOTKEY_POPUP:
-            if self._popup_mode:
-                self._popup_mode.toggle()
+            self._get_popup().toggle()
         else:
             if self.get_visible():
                 self.hide()
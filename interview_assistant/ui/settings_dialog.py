@@ -3,12 +3,24 @@
 import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Gtk, Adw
+from gi.repository import Gtk, Adw, GLib
 
+from pydantic import SecretStr
+
+from interview_assistant.core.async_runtime import submit
 from interview_assistant.core.config import get_config, StealthMode, AIBackend
 from interview_assistant.audio.devices import AudioDeviceManager
 from interview_assistant.ai.ollama_client import OllamaClient
 
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Last Ollama probe per URL, shared by every settings dialog:
+# url -> (monotonic time, (is_connected, models))
+_ollama_status_cache: Dict[str, Tuple[float, Tuple[bool, List[str]]]] = {}
+_ollama_status_lock = threading.Lock()
+
 
 class SettingsDialog(Adw.PreferencesWindow):
     """
@@ -22,6 +34,43 @@ class SettingsDialog(Adw.PreferencesWindow):
     - UI preferences
     """
 
+    # How long a successful Ollama probe is reused, in seconds
+    OLLAMA_STATUS_TTL = 30.0
+
+    # Quiet period after the last edit before the config is written
+    SAVE_DELAY_MS = 250
+
+    # Combo row values in display order, with value -> row index lookups
+    DEFAULT_OLLAMA_MODELS = (
+        "llama3.1:8b",
+        "deepseek-coder-v2:16b",
+        "codellama:13b",
+        "mistral:7b",
+        "qwen2.5-coder:7b",
+    )
+    DEFAULT_OLLAMA_INDEX = {m: i for i, m in enumerate(DEFAULT_OLLAMA_MODELS)}
+
+    CLAUDE_MODELS = (
+        "claude-sonnet-4-5-20250929",
+        "claude-opus-4-5-20250929",
+        "claude-3-5-haiku-20241022",
+    )
+    CLAUDE_INDEX = {m: i for i, m in enumerate(CLAUDE_MODELS)}
+
+    WHISPER_MODELS = ("tiny", "base", "small", "medium", "large-v3")
+    WHISPER_INDEX = {m: i for i, m in enumerate(WHISPER_MODELS)}
+
+    STEALTH_MODES = (
+        StealthMode.NORMAL,
+        StealthMode.OVERLAY,
+        StealthMode.SECONDARY_MONITOR,
+        StealthMode.HOTKEY_POPUP,
+    )
+    STEALTH_INDEX = {m: i for i, m in enumerate(STEALTH_MODES)}
+
+    BACKENDS = (AIBackend.OLLAMA, AIBackend.CLAUDE)
+    COMPUTE_DEVICES = ("auto", "cpu", "cuda")
+
     def __init__(self, parent: Gtk.Window):
         super().__init__()
 
@@ -31,17 +80,44 @@ class SettingsDialog(Adw.PreferencesWindow):
         self.set_default_size(600, 500)
 
         self._config = get_config()
-        self._device_manager = AudioDeviceManager()
+        # Device enumeration can block, so it happens on a worker thread
+        self._device_manager: Optional[AudioDeviceManager] = None
+
+        # One device enumeration at a time; a Refresh during it is queued
+        self._devices_loading = False
+        self._devices_reload = False
+
+        self._ollama_client: Optional[OllamaClient] = None
+
+        # Pending debounced config save; the API key is only wrapped in a
+        # SecretStr when that save runs
+        self._save_pending_id = 0
+        self._pending_api_key: Optional[str] = None
+        self.connect("close-request", self._on_close_request)
 
         self._build_pages()
 
     def _build_pages(self) -> None:
-        """Build all settings pages."""
+        """Build the first settings page now and the rest right after."""
+        # Only the first page is on screen when the dialog opens
         self.add(self._build_api_page())
+        GLib.idle_add(self._build_remaining_pages)
+
+        # Probe Ollama once the dialog is actually shown
+        self._map_handler = self.connect("map", self._on_first_map)
+
+    def _build_remaining_pages(self) -> bool:
+        """Idle callback that builds the pages not shown on open."""
         self.add(self._build_audio_page())
         self.add(self._build_transcription_page())
         self.add(self._build_stealth_page())
         self.add(self._build_ui_page())
+        return False
+
+    def _on_first_map(self, widget) -> None:
+        """Start the Ollama status check the first time the dialog maps."""
+        self.disconnect(self._map_handler)
+        self._check_ollama_status()
 
     def _build_api_page(self) -> Adw.PreferencesPage:
         """Build AI settings page."""
@@ -65,10 +141,7 @@ class SettingsDialog(Adw.PreferencesWindow):
         backend_row.set_model(backends)
 
         # Set current backend
-        if self._config.ai.backend == AIBackend.OLLAMA:
-            backend_row.set_selected(0)
-        else:
-            backend_row.set_selected(1)
+        backend_row.set_selected(self.BACKENDS.index(self._config.ai.backend))
 
         backend_row.connect("notify::selected", self._on_backend_changed)
         backend_group.add(backend_row)
@@ -93,22 +166,14 @@ class SettingsDialog(Adw.PreferencesWindow):
         self._ollama_model_row = ollama_model_row
 
         # Default models list
-        default_models = [
-            "llama3.1:8b",
-            "deepseek-coder-v2:16b",
-            "codellama:13b",
-            "mistral:7b",
-            "qwen2.5-coder:7b",
-        ]
-        models_list = Gtk.StringList.new(default_models)
-        ollama_model_row.set_model(models_list)
+        self._ollama_models = list(self.DEFAULT_OLLAMA_MODELS)
+        self._ollama_model_list = Gtk.StringList.new(self._ollama_models)
+        ollama_model_row.set_model(self._ollama_model_list)
 
         # Set current model
-        current = self._config.ai.ollama_model
-        for i, m in enumerate(default_models):
-            if m == current:
-                ollama_model_row.set_selected(i)
-                break
+        ollama_model_row.set_selected(
+            self.DEFAULT_OLLAMA_INDEX.get(self._config.ai.ollama_model, 0)
+        )
 
         ollama_model_row.connect("notify::selected", self._on_ollama_model_changed)
         ollama_group.add(ollama_model_row)
@@ -130,9 +195,6 @@ class SettingsDialog(Adw.PreferencesWindow):
         self._ollama_status_row.set_subtitle("Checking...")
         ollama_group.add(self._ollama_status_row)
 
-        # Check Ollama status on load
-        self._check_ollama_status()
-
         page.add(ollama_group)
 
         # Claude group
@@ -151,19 +213,11 @@ class SettingsDialog(Adw.PreferencesWindow):
         claude_model_row = Adw.ComboRow()
         claude_model_row.set_title("Model")
 
-        claude_models = Gtk.StringList.new([
-            "claude-sonnet-4-5-20250929",
-            "claude-opus-4-5-20250929",
-            "claude-3-5-haiku-20241022",
-        ])
+        claude_models = Gtk.StringList.new(list(self.CLAUDE_MODELS))
         claude_model_row.set_model(claude_models)
 
         # Set current model
-        current_model = self._config.ai.claude_model
-        for i, model in enumerate(["claude-sonnet-4-5-20250929", "claude-opus-4-5-20250929", "claude-3-5-haiku-20241022"]):
-            if model == current_model:
-                claude_model_row.set_selected(i)
-                break
+        claude_model_row.set_selected(self.CLAUDE_INDEX.get(self._config.ai.claude_model, 0))
 
         claude_model_row.connect("notify::selected", self._on_claude_model_changed)
         claude_group.add(claude_model_row)
@@ -185,93 +239,116 @@ class SettingsDialog(Adw.PreferencesWindow):
 
         return page
 
+    def _get_ollama_client(self) -> OllamaClient:
+        """Get an Ollama client for the configured URL, reusing the last one."""
+        url = self._config.ai.ollama_url.rstrip('/')
+        if self._ollama_client is None or self._ollama_client.base_url != url:
+            self._close_ollama_client()
+            self._ollama_client = OllamaClient(base_url=url)
+        return self._ollama_client
+
+    def _close_ollama_client(self) -> None:
+        """Close the cached client's connection pool on the loop that owns it."""
+        if self._ollama_client is not None:
+            submit(self._ollama_client.close())
+            self._ollama_client = None
+
+    def _cached_ollama_status(self, url: str) -> Optional[Tuple[bool, List[str]]]:
+        """Get a recent probe result for the URL, if there is one."""
+        with _ollama_status_lock:
+            entry = _ollama_status_cache.get(url)
+        if entry is not None and time.monotonic() - entry[0] < self.OLLAMA_STATUS_TTL:
+            return entry[1]
+        return None
+
+    @staticmethod
+    def _store_ollama_status(url: str, status: Tuple[bool, List[str]]) -> None:
+        """Remember a probe result for the URL."""
+        with _ollama_status_lock:
+            if status[0]:
+                _ollama_status_cache[url] = (time.monotonic(), status)
+            else:
+                # Don't keep serving "not connected" once Ollama starts
+                _ollama_status_cache.pop(url, None)
+
     def _check_ollama_status(self) -> None:
         """Check Ollama connection status."""
-        import asyncio
-        import threading
-
-        def check():
-            async def async_check():
-                client = OllamaClient(base_url=self._config.ai.ollama_url)
-                is_connected = await client.check_connection()
-                if is_connected:
-                    models = await client.list_models()
-                    return True, models
-                return False, []
-
-            loop = asyncio.new_event_loop()
+        client = self._get_ollama_client()
+
+        async def async_check():
+            cached = self._cached_ollama_status(client.base_url)
+            if cached is not None:
+                return cached
+
+            is_connected = await client.check_connection()
+            status = (True, await client.list_models()) if is_connected else (False, [])
+            self._store_ollama_status(client.base_url, status)
+            return status
+
+        def update_ui(future):
             try:
-                return loop.run_until_complete(async_check())
-            finally:
-                loop.close()
+                is_connected, models = future.result()
+            except Exception as e:
+                self._ollama_status_row.set_subtitle(f"Error: {e}")
+                return
 
-        def update_ui(result):
-            is_connected, models = result
             if is_connected:
                 self._ollama_status_row.set_subtitle(f"Connected - {len(models)} models available")
             else:
                 self._ollama_status_row.set_subtitle("Not connected - Run: ollama serve")
 
-        def run_check():
-            try:
-                result = check()
-                from gi.repository import GLib
-                GLib.idle_add(update_ui, result)
-            except Exception as e:
-                from gi.repository import GLib
-                GLib.idle_add(lambda: self._ollama_status_row.set_subtitle(f"Error: {e}"))
-
-        thread = threading.Thread(target=run_check, daemon=True)
-        thread.start()
+        submit(async_check()).add_done_callback(lambda f: GLib.idle_add(update_ui, f))
 
     def _on_refresh_ollama_models(self, button) -> None:
         """Refresh Ollama models list."""
-        import asyncio
-        import threading
-
-        def refresh():
-            async def async_refresh():
-                client = OllamaClient(base_url=self._config.ai.ollama_url)
-                return await client.list_models()
+        client = self._get_ollama_client()
 
-            loop = asyncio.new_event_loop()
+        def update_ui(future):
             try:
-                return loop.run_until_complete(async_refresh())
-            finally:
-                loop.close()
+                models = future.result()
+            except Exception as e:
+                self._ollama_status_row.set_subtitle(f"Error: {e}")
+                return
 
-        def update_ui(models):
             if models:
-                model_list = Gtk.StringList.new(models)
-                self._ollama_model_row.set_model(model_list)
-
-                # Select current model if in list
-                current = self._config.ai.ollama_model
-                for i, m in enumerate(models):
-                    if m == current:
-                        self._ollama_model_row.set_selected(i)
-                        break
-
+                self._update_ollama_models(models)
                 self._ollama_status_row.set_subtitle(f"Connected - {len(models)} models available")
             else:
                 self._ollama_status_row.set_subtitle("No models found or not connected")
 
-        def run_refresh():
-            try:
-                models = refresh()
-                from gi.repository import GLib
-                GLib.idle_add(update_ui, models)
-            except Exception as e:
-                from gi.repository import GLib
-                GLib.idle_add(lambda: self._ollama_status_row.set_subtitle(f"Error: {e}"))
+        async def async_refresh():
+            # An explicit refresh always probes, and refreshes the cache
+            models = await client.list_models()
+            self._store_ollama_status(client.base_url, (bool(models), models))
+            return models
+
+        submit(async_refresh()).add_done_callback(lambda f: GLib.idle_add(update_ui, f))
+
+    def _update_ollama_models(self, models: List[str]) -> None:
+        """Update the model row in place, touching only the changed tail."""
+        old = self._ollama_models
+        if models == old:
+            return
 
-        thread = threading.Thread(target=run_refresh, daemon=True)
-        thread.start()
+        # Read before the splice: it can move the selection and save it
+        current = self._config.ai.ollama_model
+
+        prefix = 0
+        for a, b in zip(old, models, strict=False):
+            if a != b:
+                break
+            prefix += 1
+
+        self._ollama_model_list.splice(prefix, len(old) - prefix, models[prefix:])
+        self._ollama_models = list(models)
+
+        # Select current model if in list
+        if current in models:
+            self._ollama_model_row.set_selected(models.index(current))
 
     def _on_backend_changed(self, row, _) -> None:
         """Handle backend change."""
-        backends = [AIBackend.OLLAMA, AIBackend.CLAUDE]
-        self._config.ai.backend = backends[row.get_selected()]
+        self._config.ai.backend = self.BACKENDS[row.get_selected()]
         self._save_config()
 
     def _on_ollama_url_changed(self, entry) -> None:
@@ -290,8 +367,7 @@ class SettingsDialog(Adw.PreferencesWindow):
 
     def _on_claude_model_changed(self, row, _) -> None:
         """Handle Claude model change."""
-        models = ["claude-sonnet-4-5-20250929", "claude-opus-4-5-20250929", "claude-3-5-haiku-20241022"]
-        self._config.ai.claude_model = models[row.get_selected()]
+        self._config.ai.claude_model = self.CLAUDE_MODELS[row.get_selected()]
         self._save_config()
 
     def _build_audio_page(self) -> Adw.PreferencesPage:
@@ -308,12 +384,10 @@ class SettingsDialog(Adw.PreferencesWindow):
         device_row = Adw.ComboRow()
         device_row.set_title("Capture Device")
 
-        # Get monitor devices
-        monitors = self._device_manager.get_monitor_devices()
-        device_names = ["Auto (Default Monitor)"] + [d.display_name for d in monitors]
-
-        devices_list = Gtk.StringList.new(device_names)
-        device_row.set_model(devices_list)
+        # Monitor devices are filled in once enumeration finishes
+        device_row.set_model(Gtk.StringList.new(["Loading..."]))
+        self._device_row = device_row
+        self._load_devices()
 
         device_row.connect("notify::selected", self._on_device_changed)
         group.add(device_row)
@@ -325,13 +399,49 @@ class SettingsDialog(Adw.PreferencesWindow):
 
         refresh_btn = Gtk.Button(label="Refresh")
         refresh_btn.set_valign(Gtk.Align.CENTER)
-        refresh_btn.connect("clicked", lambda _: self._device_manager.refresh_devices())
+        refresh_btn.connect("clicked", lambda _: self._load_devices(refresh=True))
         refresh_row.add_suffix(refresh_btn)
         group.add(refresh_row)
 
         page.add(group)
         return page
 
+    def _load_devices(self, refresh: bool = False) -> None:
+        """
+        Enumerate audio devices off the main thread and fill the device row.
+
+        Args:
+            refresh: Re-scan devices if they were already enumerated
+        """
+        if self._devices_loading:
+            self._devices_reload = self._devices_reload or refresh
+            return
+        self._devices_loading = True
+
+        def load():
+            try:
+                if self._device_manager is None:
+                    self._device_manager = AudioDeviceManager()
+                elif refresh:
+                    self._device_manager.refresh_devices()
+                monitors = self._device_manager.get_monitor_devices()
+            except Exception as e:
+                print(f"Error listing audio devices: {e}")
+                monitors = []
+
+            names = ["Auto (Default Monitor)"] + [d.display_name for d in monitors]
+            GLib.idle_add(update_ui, names)
+
+        def update_ui(names):
+            self._device_row.set_model(Gtk.StringList.new(names))
+
+            self._devices_loading = False
+            if self._devices_reload:
+                self._devices_reload = False
+                self._load_devices(refresh=True)
+
+        threading.Thread(target=load, daemon=True).start()
+
     def _build_transcription_page(self) -> Adw.PreferencesPage:
         """Build transcription settings page."""
         page = Adw.PreferencesPage()
@@ -355,12 +465,7 @@ class SettingsDialog(Adw.PreferencesWindow):
         ])
         model_row.set_model(models)
 
-        model_sizes = ["tiny", "base", "small", "medium", "large-v3"]
-        current = self._config.transcription.model_size
-        for i, size in enumerate(model_sizes):
-            if size == current:
-                model_row.set_selected(i)
-                break
+        model_row.set_selected(self.WHISPER_INDEX.get(self._config.transcription.model_size, 0))
 
         model_row.connect("notify::selected", self._on_whisper_model_changed)
         group.add(model_row)
@@ -378,6 +483,8 @@ class SettingsDialog(Adw.PreferencesWindow):
 
         devices = Gtk.StringList.new(["Auto", "CPU", "CUDA (GPU)"])
         device_row.set_model(devices)
+        if self._config.transcription.device in self.COMPUTE_DEVICES:
+            device_row.set_selected(self.COMPUTE_DEVICES.index(self._config.transcription.device))
         device_row.connect("notify::selected", self._on_compute_device_changed)
         group.add(device_row)
 
@@ -406,13 +513,7 @@ class SettingsDialog(Adw.PreferencesWindow):
         ])
         mode_row.set_model(modes)
 
-        mode_values = [StealthMode.NORMAL, StealthMode.OVERLAY,
-                      StealthMode.SECONDARY_MONITOR, StealthMode.HOTKEY_POPUP]
-        current = self._config.stealth.mode
-        for i, mode in enumerate(mode_values):
-            if mode == current:
-                mode_row.set_selected(i)
-                break
+        mode_row.set_selected(self.STEALTH_INDEX.get(self._config.stealth.mode, 0))
 
         mode_row.connect("notify::selected", self._on_stealth_mode_changed)
         group.add(mode_row)
@@ -476,8 +577,7 @@ class SettingsDialog(Adw.PreferencesWindow):
 
     # Event handlers
     def _on_api_key_changed(self, entry) -> None:
-        from pydantic import SecretStr
-        self._config.ai.api_key = SecretStr(entry.get_text())
+        self._pending_api_key = entry.get_text()
         self._save_config()
 
 
@@ -490,8 +590,7 @@ class SettingsDialog(Adw.PreferencesWindow):
         pass
 
     def _on_whisper_model_changed(self, row, _) -> None:
-        models = ["tiny", "base", "small", "medium", "large-v3"]
-        self._config.transcription.model_size = models[row.get_selected()]
+        self._config.transcription.model_size = self.WHISPER_MODELS[row.get_selected()]
         self._save_config()
 
     def _on_language_changed(self, entry) -> None:
@@ -499,14 +598,11 @@ class SettingsDialog(Adw.PreferencesWindow):
         self._save_config()
 
     def _on_compute_device_changed(self, row, _) -> None:
-        devices = ["auto", "cpu", "cuda"]
-        self._config.transcription.device = devices[row.get_selected()]
+        self._config.transcription.device = self.COMPUTE_DEVICES[row.get_selected()]
         self._save_config()
 
     def _on_stealth_mode_changed(self, row, _) -> None:
-        modes = [StealthMode.NORMAL, StealthMode.OVERLAY,
-                StealthMode.SECONDARY_MONITOR, StealthMode.HOTKEY_POPUP]
-        self._config.stealth.mode = modes[row.get_selected()]
+        self._config.stealth.mode = self.STEALTH_MODES[row.get_selected()]
         self._save_config()
 
     def _on_timeout_changed(self, row) -> None:
@@ -526,8 +622,29 @@ class SettingsDialog(Adw.PreferencesWindow):
         self._save_config()
 
     def _save_config(self) -> None:
-        """Save configuration to file."""
+        """Save configuration to file once edits pause."""
+        if self._save_pending_id:
+            GLib.source_remove(self._save_pending_id)
+        self._save_pending_id = GLib.timeout_add(self.SAVE_DELAY_MS, self._flush_save)
+
+    def _flush_save(self) -> bool:
+        """Write the configuration now."""
+        self._save_pending_id = 0
+
+        if self._pending_api_key is not None:
+            self._config.ai.api_key = SecretStr(self._pending_api_key)
+            self._pending_api_key = None
+
         try:
             self._config.save()
         except Exception as e:
             print(f"Error saving config: {e}")
+        return GLib.SOURCE_REMOVE
+
+    def _on_close_request(self, window) -> bool:
+        """Write any pending edits and release connections before closing."""
+        if self._save_pending_id:
+            GLib.source_remove(self._save_pending_id)
+            self._flush_save()
+        self._close_ollama_client()
+        return False
@@ -0,0 +1,50 @@
+"""Application stylesheet loading."""
+
+import gi
+gi.require_version("Gtk", "4.0")
+from gi.repository import Gtk, Gdk
+
+import logging
+from pathlib import Path
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+# Stylesheets in cascade order; later files override earlier ones
+CSS_PATHS = [
+    Path(__file__).parent.parent / "resources" / "styles" / "glassmorphism.css",
+    Path.home() / ".config" / "interview-assistant" / "styles" / "custom.css",
+]
+
+# Providers registered on the display, kept alive for the process
+_css_providers: List[Gtk.CssProvider] = []
+_css_loaded = False
+
+
+def ensure_styles_loaded() -> None:
+    """
+    Register the application stylesheets on the default display.
+
+    Runs once per process; every window that uses the shared CSS classes
+    calls this, and later calls are no-ops.
+    """
+    global _css_loaded
+    if _css_loaded:
+        return
+    _css_loaded = True
+
+    display = Gdk.Display.get_default()
+
+    for css_path in CSS_PATHS:
+        if css_path.exists():
+            try:
+                css_provider = Gtk.CssProvider()
+                css_provider.load_from_path(str(css_path))
+                Gtk.StyleContext.add_provider_for_display(
+                    display,
+                    css_provider,
+                    Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+                )
+                _css_providers.append(css_provider)
+            except Exception as e:
+                logger.warning("Error loading CSS from %s: %s", css_path, e)
@@ -2,7 +2,10 @@
 
 import gi
 gi.require_version("Gtk", "4.0")
-from gi.repository import Gtk, GLib, Pango
+from gi.repository import Gtk, Gio, GLib, GObject, Pango
+
+from collections import deque
+from datetime import datetime
 
 from interview_assistant.core.events import Event, get_event_bus
 
@@ -14,9 +17,17 @@ class TranscriptView(Gtk.Box):
     Updates in real-time as speech is transcribed.
     """
 
-    def __init__(self):
+    # Oldest text is dropped beyond this many characters
+    MAX_CHARS = 8192
+
+    # Placed between transcript entries
+    SEPARATOR = "\n\n"
+
+    def __init__(self, max_chars: int = MAX_CHARS):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=8)
 
+        self._max_chars = max_chars
+
         self.add_css_class("glass-card")
 
         # Header
@@ -65,6 +76,20 @@ class TranscriptView(Gtk.Box):
         self._status_label.set_halign(Gtk.Align.START)
         self.append(self._status_label)
 
+        # Transcript entries ("Q: ..." blocks) are the source of truth; the
+        # buffer only displays them. _char_count includes separators.
+        self._entries: deque = deque()
+        self._char_count = 0
+
+        # Questions are inserted in one buffer mutation per idle, and at most
+        # one scroll is queued at a time
+        self._pending_text: list = []
+        self._flush_scheduled = False
+        self._scroll_pending = False
+
+        # Most recent question, kept so it never has to be parsed back out
+        self._last_question = ""
+
         # Subscribe to events
         self._event_bus = get_event_bus()
         self._event_bus.subscribe(Event.TRANSCRIPTION_STARTED, self._on_transcription_started)
@@ -107,18 +132,32 @@ class TranscriptView(Gtk.Box):
         Args:
             text: Text to append
         """
-        end_iter = self._buffer.get_end_iter()
-
-        # Add timestamp or separator if not empty
-        if self._buffer.get_char_count() > 0:
-            self._buffer.insert(end_iter, "\n\n")
-            end_iter = self._buffer.get_end_iter()
-
-        # Insert the text
-        self._buffer.insert(end_iter, f"Q: {text}")
-
-        # Scroll to bottom
-        self._scroll_to_bottom()
+        entry = f"Q: {text}"
+        self._add_entry(entry)
+        self._last_question = text.strip()
+        self._pending_text.append(entry)
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            GLib.idle_add(self._flush_pending)
+
+    def _flush_pending(self) -> bool:
+        """Insert all pending questions in a single buffer mutation."""
+        self._flush_scheduled = False
+        if self._pending_text:
+            rendered = len(self._entries) - len(self._pending_text)
+            text = self.SEPARATOR.join(self._pending_text)
+            self._pending_text.clear()
+
+            # Add separator if not empty
+            if rendered > 0:
+                text = self.SEPARATOR + text
+            self._buffer.insert(self._buffer.get_end_iter(), text)
+            self._trim()
+
+            # Scroll to bottom
+            self._scroll_to_bottom()
+        return False
 
     def set_text(self, text: str) -> None:
         """
@@ -127,40 +166,110 @@ class TranscriptView(Gtk.Box):
         Args:
             text: Full transcript text
         """
+        self._pending_text.clear()
+        self._entries.clear()
+        self._char_count = 0
+        if text:
+            self._add_entry(text)
         self._buffer.set_text(text)
+        self._trim()
+        self._last_question = self._parse_last_question(text)
         self._scroll_to_bottom()
 
+    def _add_entry(self, entry: str) -> None:
+        """Record an entry in the model and its length."""
+        if self._entries:
+            self._char_count += len(self.SEPARATOR)
+        self._entries.append(entry)
+        self._char_count += len(entry)
+
+    def _trim(self) -> None:
+        """Drop the oldest text so the transcript stays under max_chars."""
+        if self._char_count <= self._max_chars:
+            return
+
+        # Whole entries go first, so the model knows exactly what to cut
+        dropped = 0
+        while len(self._entries) > 1 and self._char_count > self._max_chars:
+            removed = len(self._entries.popleft()) + len(self.SEPARATOR)
+            self._char_count -= removed
+            dropped += removed
+
+        # A single oversized entry is cut on a line boundary
+        if self._char_count > self._max_chars:
+            entry = self._entries[0]
+            cut = entry.find("\n", self._char_count - self._max_chars)
+            cut = len(entry) if cut < 0 else cut + 1
+            if cut < len(entry):
+                self._entries[0] = entry[cut:]
+                self._char_count -= cut
+                dropped += cut
+            else:
+                self._entries.clear()
+                dropped += self._char_count
+                self._char_count = 0
+
+        self._buffer.delete(
+            self._buffer.get_start_iter(),
+            self._buffer.get_iter_at_offset(dropped),
+        )
+
     def get_text(self) -> str:
         """Get the current transcript text."""
-        start = self._buffer.get_start_iter()
-        end = self._buffer.get_end_iter()
-        return self._buffer.get_text(start, end, True)
+        return self.SEPARATOR.join(self._entries)
 
     def get_last_question(self) -> str:
         """Get the most recent question."""
-        text = self.get_text()
+        return self._last_question
+
+    @staticmethod
+    def _parse_last_question(text: str) -> str:
+        """Find the most recent question in a full transcript."""
         if not text:
             return ""
 
-        # Split by "Q:" markers
-        parts = text.split("Q:")
-        if len(parts) > 1:
-            return parts[-1].strip()
-        return text.strip()
+        # Text after the last "Q:" marker
+        _, sep, tail = text.rpartition("Q:")
+        return tail.strip() if sep else text.strip()
 
     def clear(self) -> None:
         """Clear the transcript."""
+        self._pending_text.clear()
+        self._entries.clear()
+        self._char_count = 0
         self._buffer.set_text("")
+        self._last_question = ""
         self._status_label.set_label("Transcript cleared")
 
     def _scroll_to_bottom(self) -> None:
         """Scroll the text view to the bottom."""
-        def scroll():
-            adj = self._text_view.get_parent().get_vadjustment()
-            adj.set_value(adj.get_upper() - adj.get_page_size())
-            return False
+        if self._scroll_pending:
+            return
+        self._scroll_pending = True
+        # Low priority so the scroll runs after pending layout work settles
+        GLib.idle_add(self._do_scroll, priority=GLib.PRIORITY_LOW)
+
+    def _do_scroll(self) -> bool:
+        """Idle callback for _scroll_to_bottom."""
+        self._scroll_pending = False
+        adj = self._text_view.get_parent().get_vadjustment()
+        adj.set_value(adj.get_upper() - adj.get_page_size())
+        return False
+
 
-        GLib.idle_add(scroll)
+class QuestionItem(GObject.Object):
+    """GObject wrapper so a past question can be held in a Gio.ListStore."""
+
+    __gtype_name__ = "InterviewAssistantQuestionItem"
+
+    def __init__(self, text: str, time: datetime):
+        super().__init__()
+        self.text = text
+        self.time = time
+
+        # Row labels, computed once so binding a recycled row does no string work
+        self.preview = text[:100] + "..." if len(text) > 100 else text
+        self.time_str = time.strftime("%H:%M:%S")
 
 
 class TranscriptHistory(Gtk.Box):
@@ -175,13 +284,22 @@ class TranscriptHistory(Gtk.Box):
 
         self._questions = []
 
-        # List box for questions
-        self._list_box = Gtk.ListBox()
-        self._list_box.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self._list_box.add_css_class("glass-surface")
+        # Rows are recycled by the factory, so only the visible ones exist
+        self._store = Gio.ListStore.new(QuestionItem)
+
+        selection = Gtk.SingleSelection(model=self._store)
+        selection.set_autoselect(False)
+        selection.set_can_unselect(True)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_row_setup)
+        factory.connect("bind", self._on_row_bind)
+
+        self._list_view = Gtk.ListView(model=selection, factory=factory)
+        self._list_view.add_css_class("glass-surface")
 
         scroll = Gtk.ScrolledWindow()
-        scroll.set_child(self._list_box)
+        scroll.set_child(self._list_view)
         scroll.set_vexpand(True)
 
         self.append(scroll)
@@ -190,22 +308,8 @@ class TranscriptHistory(Gtk.Box):
         self._event_bus = get_event_bus()
         self._event_bus.subscribe(Event.TRANSCRIPTION_COMPLETE, self._on_new_question)
 
-    def _on_new_question(self, text: str) -> None:
-        """Handle new question."""
-        if text:
-            self.add_question(text)
-
-    def add_question(self, text: str) -> None:
-        """Add a question to history."""
-        from datetime import datetime
-
-        self._questions.append({
-            'text': text,
-            'time': datetime.now(),
-        })
-
-        # Create row
-        row = Gtk.ListBoxRow()
+    def _on_row_setup(self, factory, list_item: Gtk.ListItem) -> None:
+        """Build a row template; it is reused for whichever item it shows."""
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
         box.set_margin_top(8)
         box.set_margin_bottom(8)
@@ -213,32 +317,69 @@ class TranscriptHistory(Gtk.Box):
         box.set_margin_end(8)
 
         # Question text (truncated)
-        display_text = text[:100] + "..." if len(text) > 100 else text
-        label = Gtk.Label(label=display_text)
+        label = Gtk.Label()
         label.set_halign(Gtk.Align.START)
         label.set_wrap(True)
         label.add_css_class("transcript-text")
         box.append(label)
 
         # Timestamp
-        time_str = datetime.now().strftime("%H:%M:%S")
-        time_label = Gtk.Label(label=time_str)
+        time_label = Gtk.Label()
         time_label.set_halign(Gtk.Align.START)
         time_label.add_css_class("text-muted")
         box.append(time_label)
 
-        row.set_child(box)
-        self._list_box.append(row)
+        # Store references for bind
+        box._label = label
+        box._time_label = time_label
+
+        list_item.set_child(box)
+
+    def _on_row_bind(self, factory, list_item: Gtk.ListItem) -> None:
+        """Fill a recycled row with its question."""
+        box = list_item.get_child()
+        item = list_item.get_item()
+        box._label.set_label(item.preview)
+        box._time_label.set_label(item.time_str)
+
+    def _on_new_question(self, text: str) -> None:
+        """Handle new question."""
+        if text:
+            self.add_question(text)
+
+    def add_question(self, text: str) -> None:
+        """Add a question to history."""
+        now = datetime.now()
+
+        self._questions.append({
+            'text': text,
+            'time': now,
+        })
+        self._store.append(QuestionItem(text, now))
+
+    def bulk_add(self, questions: list) -> None:
+        """
+        Add many questions at once, e.g. when restoring a saved session.
+
+        The store is spliced in one call, so the list view sees a single
+        change instead of one per question.
+
+        Args:
+            questions: Dicts with 'text' and 'time' keys, as returned by
+                get_questions()
+        """
+        questions = [dict(q) for q in questions]
+        if not questions:
+            return
+
+        items = [QuestionItem(q['text'], q['time']) for q in questions]
+        self._questions.extend(questions)
+        self._store.splice(self._store.get_n_items(), 0, items)
 
     def clear(self) -> None:
         """Clear all history."""
         self._questions = []
-        while True:
-            row = self._list_box.get_row_at_index(0)
-            if row:
-                self._list_box.remove(row)
-            else:
-                break
+        self._store.remove_all()
 
     def get_questions(self) -> list:
         """Get all questions."""
@@ -4,6 +4,9 @@ import gi
 gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk, GLib
 
+import math
+from typing import Optional
+
 from interview_assistant.core.events import Event, get_event_bus
 
 
@@ -14,29 +17,34 @@ class AudioLevelIndicator(Gtk.Box):
     Displays real-time audio level from the capture source.
     """
 
+    TICK_MS = 50
+
+    # Time constants in seconds; coefficients are derived from the real
+    # interval between ticks, so the feel does not depend on TICK_MS
+    SMOOTHING_TAU = 0.14
+    DECAY_TAU = 0.975
+
     def __init__(self, width: int = 100, height: int = 8):
         super().__init__(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
 
         self._level = 0.0
         self._target_level = 0.0
-        self._smoothing = 0.3
+        self._last_tick_us = 0
 
-        # Create the meter
-        self._meter_bg = Gtk.Box()
-        self._meter_bg.set_size_request(width, height)
-        self._meter_bg.add_css_class("audio-meter")
+        # Loudest sample since the last tick; written from the capture thread
+        self._pending_level: Optional[float] = None
 
-        self._meter_fill = Gtk.Box()
-        self._meter_fill.set_size_request(0, height)
-        self._meter_fill.add_css_class("audio-meter-fill")
-        self._meter_fill.set_halign(Gtk.Align.START)
+        # Level last pushed to the meter
+        self._shown_level = 0.0
 
-        # Use an overlay to stack them
-        overlay = Gtk.Overlay()
-        overlay.set_child(self._meter_bg)
-        overlay.add_overlay(self._meter_fill)
+        # Fixed-size progress bar; changing its fraction does not resize
+        # the widget, unlike growing a fill box with set_size_request
+        self._meter = Gtk.ProgressBar()
+        self._meter.set_size_request(width, height)
+        self._meter.set_valign(Gtk.Align.CENTER)
+        self._meter.add_css_class("audio-meter")
 
-        self.append(overlay)
+        self.append(self._meter)
 
         self._width = width
         self._height = height
@@ -45,24 +53,54 @@ class AudioLevelIndicator(Gtk.Box):
         self._event_bus = get_event_bus()
         self._event_bus.subscribe(Event.AUDIO_LEVEL, self._on_audio_level)
 
-        # Start animation timer
-        self._timer_id = GLib.timeout_add(50, self._update_animation)
+        # Animation timer only runs while the meter is on screen
+        self._timer_id = None
+        self.connect("map", self._on_map)
+        self.connect("unmap", self._on_unmap)
+
+    def _on_map(self, widget) -> None:
+        """Start the animation timer when the meter is shown."""
+        if self._timer_id is None:
+            self._last_tick_us = GLib.get_monotonic_time()
+            self._timer_id = GLib.timeout_add(self.TICK_MS, self._update_animation)
+
+    def _on_unmap(self, widget) -> None:
+        """Stop the animation timer when the meter is hidden."""
+        self.cleanup()
 
     def _on_audio_level(self, level: float) -> None:
-        """Handle audio level update."""
-        self._target_level = min(1.0, max(0.0, level))
+        """Latch the audio level; the animation tick picks it up."""
+        pending = self._pending_level
+        self._pending_level = level if pending is None else max(pending, level)
 
     def _update_animation(self) -> bool:
         """Smooth animation update."""
+        now = GLib.get_monotonic_time()
+        dt = (now - self._last_tick_us) / 1e6
+        self._last_tick_us = now
+
+        pending, self._pending_level = self._pending_level, None
+        if pending is not None:
+            self._target_level = min(1.0, max(0.0, pending))
+
+        # Nothing to animate at rest
+        if self._level < 1e-3 and self._target_level < 1e-3:
+            if self._shown_level:
+                self._shown_level = 0.0
+                self._meter.set_fraction(0.0)
+            return True
+
         # Smooth transition
-        self._level += (self._target_level - self._level) * self._smoothing
+        alpha = 1.0 - math.exp(-dt / self.SMOOTHING_TAU)
+        self._level += (self._target_level - self._level) * alpha
 
         # Decay
-        self._target_level *= 0.95
+        self._target_level *= math.exp(-dt / self.DECAY_TAU)
 
-        # Update meter width
-        width = int(self._level * self._width)
-        self._meter_fill.set_size_request(width, self._height)
+        # Update meter only on a visible change
+        if abs(self._level - self._shown_level) > 0.01:
+            self._shown_level = self._level
+            self._meter.set_fraction(self._level)
 
         return True  # Continue timer
 
@@ -89,12 +127,26 @@ class AudioLevelBar(Gtk.DrawingArea):
     Provides smoother visuals with gradient.
     """
 
+    TICK_MS = 33  # ~30fps
+
+    # Peak marker hold time and decay time constant, in seconds
+    PEAK_HOLD = 1.0
+    PEAK_DECAY_TAU = 0.643
+
     def __init__(self, width: int = 120, height: int = 6):
         super().__init__()
 
         self._level = 0.0
         self._peak = 0.0
-        self._peak_hold = 30  # frames
+        self._peak_hold = self.PEAK_HOLD  # seconds left
+        self._last_tick_us = 0
+
+        # Loudest sample since the last tick; written from the capture thread
+        self._pending_level: Optional[float] = None
+
+        # State of the last queued frame; redraw only when it visibly differs
+        self._drawn_level = 0.0
+        self._drawn_peak = 0.0
 
         self.set_size_request(width, height)
         self.set_draw_func(self._draw)
@@ -106,27 +158,57 @@ class AudioLevelBar(Gtk.DrawingArea):
         self._event_bus = get_event_bus()
         self._event_bus.subscribe(Event.AUDIO_LEVEL, self._on_audio_level)
 
-        # Animation timer
-        self._timer_id = GLib.timeout_add(33, self._tick)  # ~30fps
+        # Animation timer only runs while the bar is on screen
+        self._timer_id = None
+        self.connect("map", self._on_map)
+        self.connect("unmap", self._on_unmap)
 
-    def _on_audio_level(self, level: float) -> None:
-        """Handle audio level update."""
-        self._level = min(1.0, max(0.0, level))
+    def _on_map(self, widget) -> None:
+        """Start the animation timer when the bar is shown."""
+        if self._timer_id is None:
+            self._last_tick_us = GLib.get_monotonic_time()
+            self._timer_id = GLib.timeout_add(self.TICK_MS, self._tick)
+
+    def _on_unmap(self, widget) -> None:
+        """Stop the animation timer when the bar is hidden."""
+        self.cleanup()
 
-        # Update peak
-        if self._level > self._peak:
-            self._peak = self._level
-            self._peak_hold = 30
+    def _on_audio_level(self, level: float) -> None:
+        """Latch the audio level; the animation tick picks it up."""
+        pending = self._pending_level
+        self._pending_level = level if pending is None else max(pending, level)
 
     def _tick(self) -> bool:
         """Animation tick."""
-        # Decay peak
-        if self._peak_hold > 0:
-            self._peak_hold -= 1
-        else:
-            self._peak *= 0.95
+        now = GLib.get_monotonic_time()
+        dt = (now - self._last_tick_us) / 1e6
+        self._last_tick_us = now
+
+        pending, self._pending_level = self._pending_level, None
+        if pending is not None:
+            self._level = min(1.0, max(0.0, pending))
 
-        self.queue_draw()
+            # Update peak
+            if self._level > self._peak:
+                self._peak = self._level
+                self._peak_hold = self.PEAK_HOLD
+
+        # Decay peak; below the draw threshold it is gone
+        if self._peak_hold > 0:
+            self._peak_hold -= dt
+        elif self._peak:
+            self._peak *= math.exp(-dt / self.PEAK_DECAY_TAU)
+            if self._peak <= 0.01:
+                self._peak = 0.0
+
+        # Redraw only when something moved by at least a pixel
+        min_step = 1.0 / self._width
+        if (abs(self._level - self._drawn_level) >= min_step
+                or abs(self._peak - self._drawn_peak) >= min_step
+                or (self._peak == 0.0) != (self._drawn_peak == 0.0)):
+            self._drawn_level = self._level
+            self._drawn_peak = self._peak
+            self.queue_draw()
         return True
 
     def _draw(self, area, cr, width, height) -> None:
@@ -161,7 +243,6 @@ class AudioLevelBar(Gtk.DrawingArea):
 
     def _rounded_rect(self, cr, x, y, width, height, radius) -> None:
         """Draw a rounded rectangle path."""
-        import math
         cr.new_path()
         cr.arc(x + radius, y + radius, radius, math.pi, 1.5 * math.pi)
         cr.arc(x + width - radius, y + radius, radius, 1.5 * math.pi, 2 * math.pi)
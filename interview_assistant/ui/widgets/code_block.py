@@ -5,6 +5,8 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("GtkSource", "5")
 from gi.repository import Gtk, GtkSource, Gdk, GLib
 
+from typing import Dict, Optional
+
 
 class CodeBlockView(Gtk.Box):
     """
@@ -13,6 +15,14 @@ class CodeBlockView(Gtk.Box):
     Uses GtkSourceView for proper code highlighting.
     """
 
+    # Dark schemes to try, in order of preference
+    STYLE_SCHEMES = ["Adwaita-dark", "oblivion", "cobalt", "classic-dark"]
+
+    # Shared across instances: language name -> resolved language (or None)
+    _LANG_CACHE: Dict[str, Optional[GtkSource.Language]] = {}
+    _style_scheme: Optional[GtkSource.StyleScheme] = None
+    _style_scheme_resolved = False
+
     def __init__(self, language: str = "python", code: str = ""):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0)
 
@@ -32,15 +42,32 @@ class CodeBlockView(Gtk.Box):
         header.append(spacer)
 
         # Copy button
-        copy_button = Gtk.Button()
-        copy_button.set_icon_name("edit-copy-symbolic")
-        copy_button.add_css_class("flat")
-        copy_button.set_tooltip_text("Copy code")
-        copy_button.connect("clicked", self._on_copy_clicked)
-        header.append(copy_button)
+        self._copy_button = Gtk.Button()
+        self._copy_button.set_icon_name("edit-copy-symbolic")
+        self._copy_button.add_css_class("flat")
+        self._copy_button.set_tooltip_text("Copy code")
+        self._copy_button.connect("clicked", self._on_copy_clicked)
+        header.append(self._copy_button)
+
+        # Pending timeout that restores the copy icon
+        self._copy_revert_id: Optional[int] = None
 
         self.append(header)
 
+        # The source view is built on first non-empty content
+        self._source_view: Optional[GtkSource.View] = None
+        self._buffer: Optional[GtkSource.Buffer] = None
+        self._lang_manager: Optional[GtkSource.LanguageManager] = None
+
+        # Set initial content
+        if code:
+            self.set_code(code, language)
+
+    def _ensure_view(self) -> None:
+        """Build the source view, buffer and scroller on first use."""
+        if self._source_view is not None:
+            return
+
         # Source view
         self._source_view = GtkSource.View()
         self._source_view.set_editable(False)
@@ -62,13 +89,9 @@ class CodeBlockView(Gtk.Box):
         self._lang_manager = GtkSource.LanguageManager.get_default()
 
         # Set up style scheme (dark theme)
-        style_manager = GtkSource.StyleSchemeManager.get_default()
-        # Try different dark schemes
-        for scheme_name in ["Adwaita-dark", "oblivion", "cobalt", "classic-dark"]:
-            scheme = style_manager.get_scheme(scheme_name)
-            if scheme:
-                self._buffer.set_style_scheme(scheme)
-                break
+        scheme = self._get_style_scheme()
+        if scheme:
+            self._buffer.set_style_scheme(scheme)
 
         # Scrolled window
         scroll = Gtk.ScrolledWindow()
@@ -79,9 +102,29 @@ class CodeBlockView(Gtk.Box):
 
         self.append(scroll)
 
-        # Set initial content
-        if code:
-            self.set_code(code, language)
+    @classmethod
+    def _get_style_scheme(cls) -> Optional[GtkSource.StyleScheme]:
+        """Find the first available dark scheme, once per process."""
+        if not cls._style_scheme_resolved:
+            style_manager = GtkSource.StyleSchemeManager.get_default()
+            for scheme_name in cls.STYLE_SCHEMES:
+                scheme = style_manager.get_scheme(scheme_name)
+                if scheme:
+                    cls._style_scheme = scheme
+                    break
+            cls._style_scheme_resolved = True
+        return cls._style_scheme
+
+    @classmethod
+    def _resolve_lang(cls, manager: GtkSource.LanguageManager,
+                      name: str) -> Optional[GtkSource.Language]:
+        """Look up a language by id, falling back to a MIME-type guess."""
+        if name not in cls._LANG_CACHE:
+            cls._LANG_CACHE[name] = (
+                manager.get_language(name)
+                or manager.guess_language(None, f"text/{name}")
+            )
+        return cls._LANG_CACHE[name]
 
     def set_code(self, code: str, language: str = "python") -> None:
         """
@@ -94,21 +137,22 @@ class CodeBlockView(Gtk.Box):
         # Update language label
         self._language_label.set_label(language.upper())
 
+        if not code and self._source_view is None:
+            return
+        self._ensure_view()
+
         # Set language for highlighting
-        lang = self._lang_manager.get_language(language)
+        lang = self._resolve_lang(self._lang_manager, language)
         if lang:
             self._buffer.set_language(lang)
-        else:
-            # Try to guess language
-            lang = self._lang_manager.guess_language(None, f"text/{language}")
-            if lang:
-                self._buffer.set_language(lang)
 
         # Set text
         self._buffer.set_text(code)
 
     def get_code(self) -> str:
         """Get the code content."""
+        if self._buffer is None:
+            return ""
         start = self._buffer.get_start_iter()
         end = self._buffer.get_end_iter()
         return self._buffer.get_text(start, end, True)
@@ -116,12 +160,24 @@ class CodeBlockView(Gtk.Box):
     def _on_copy_clicked(self, button) -> None:
         """Copy code to clipboard."""
         clipboard = Gdk.Display.get_default().get_clipboard()
+
+        # Hand the clipboard UTF-8 bytes directly so it does not re-encode
         code = self.get_code()
-        clipboard.set(code)
+        clipboard.set_content(Gdk.ContentProvider.new_for_bytes(
+            "text/plain;charset=utf-8", GLib.Bytes.new(code.encode("utf-8"))
+        ))
 
-        # Visual feedback
+        # Visual feedback; a repeat click restarts the revert timer
         button.set_icon_name("emblem-ok-symbolic")
-        GLib.timeout_add(1500, lambda: button.set_icon_name("edit-copy-symbolic"))
+        if self._copy_revert_id:
+            GLib.source_remove(self._copy_revert_id)
+        self._copy_revert_id = GLib.timeout_add(1500, self._revert_copy_icon)
+
+    def _revert_copy_icon(self) -> bool:
+        """Restore the copy icon after the feedback delay."""
+        self._copy_revert_id = None
+        self._copy_button.set_icon_name("edit-copy-symbolic")
+        return False
 
 
 class InlineCode(Gtk.Label):
@@ -133,7 +189,17 @@ class InlineCode(Gtk.Label):
         super().__init__(label=code)
 
         self.add_css_class("code-inline")
+
+        # Selection support is set up on first hover rather than for every span
+        self._hover = Gtk.EventControllerMotion()
+        self._hover.connect("enter", self._on_enter)
+        self.add_controller(self._hover)
+
+    def _on_enter(self, controller, x, y) -> None:
+        """Make the span selectable once the pointer reaches it."""
         self.set_selectable(True)
+        self.remove_controller(self._hover)
+        self._hover = None
 
     def set_code(self, code: str) -> None:
         """Set the code text."""
@@ -148,10 +214,19 @@ class CodeBlockContainer(Gtk.Box):
     """
 
     def __init__(self):
-        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0)
+
+        # Blocks live in an inner box so clear() can drop them all at once
+        self._inner = self._new_inner()
+        self.append(self._inner)
 
         self._blocks = []
 
+    @staticmethod
+    def _new_inner() -> Gtk.Box:
+        """Create the box that holds the code blocks."""
+        return Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+
     def add_code_block(self, code: str, language: str = "python") -> CodeBlockView:
         """
         Add a code block.
@@ -165,13 +240,18 @@ class CodeBlockContainer(Gtk.Box):
         """
         block = CodeBlockView(language, code)
         self._blocks.append(block)
-        self.append(block)
+        self._inner.append(block)
         return block
 
     def clear(self) -> None:
         """Remove all code blocks."""
-        for block in self._blocks:
-            self.remove(block)
+        if not self._blocks:
+            return
+
+        # One child swap instead of a relayout per removed block
+        self.remove(self._inner)
+        self._inner = self._new_inner()
+        self.append(self._inner)
         self._blocks = []
 
     def get_all_code(self) -> list:
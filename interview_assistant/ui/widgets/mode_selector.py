@@ -7,6 +7,17 @@ from gi.repository import Gtk, GObject
 from interview_assistant.ai.prompts import InterviewType, get_all_interview_types
 from interview_assistant.core.events import Event, get_event_bus
 
+# (mode, display name) pairs, shared by every selector
+_INTERVIEW_TYPES = tuple(get_all_interview_types())
+
+# Badge label and CSS class for each interview type
+_BADGE_INFO = {
+    InterviewType.DSA: ("DSA", "dsa"),
+    InterviewType.SYSTEM_DESIGN: ("System Design", "system-design"),
+    InterviewType.BEHAVIORAL: ("Behavioral", "behavioral"),
+}
+_BADGE_CLASSES = frozenset(css_class for _, css_class in _BADGE_INFO.values())
+
 
 class ModeSelector(Gtk.Box):
     """
@@ -37,9 +48,10 @@ class ModeSelector(Gtk.Box):
         self._model = Gtk.StringList()
         self._modes = []
 
-        for mode, display_name in get_all_interview_types():
+        for mode, display_name in _INTERVIEW_TYPES:
             self._model.append(display_name)
             self._modes.append(mode)
+        self._mode_index = {mode: i for i, mode in enumerate(self._modes)}
 
         self._dropdown.set_model(self._model)
         self._dropdown.connect("notify::selected", self._on_selection_changed)
@@ -65,12 +77,10 @@ class ModeSelector(Gtk.Box):
         Args:
             mode: Interview type to select
         """
-        try:
-            index = self._modes.index(mode)
+        index = self._mode_index.get(mode)
+        if index is not None:
             self._dropdown.set_selected(index)
             self._current_mode = mode
-        except ValueError:
-            pass
 
 
 class ModeSelectorButtons(Gtk.Box):
@@ -94,7 +104,7 @@ class ModeSelectorButtons(Gtk.Box):
         # Create toggle buttons for each mode
         first_button = None
 
-        for mode, display_name in get_all_interview_types():
+        for mode, display_name in _INTERVIEW_TYPES:
             button = Gtk.ToggleButton(label=display_name)
             button.add_css_class("toggle-button")
 
@@ -154,21 +164,14 @@ class InterviewTypeBadge(Gtk.Label):
 
     def _update_badge(self) -> None:
         """Update badge appearance."""
-        # Remove old classes
-        for cls in ["dsa", "system-design", "behavioral"]:
-            self.remove_css_class(cls)
-
-        # Set text and class
-        display_names = {
-            InterviewType.DSA: ("DSA", "dsa"),
-            InterviewType.SYSTEM_DESIGN: ("System Design", "system-design"),
-            InterviewType.BEHAVIORAL: ("Behavioral", "behavioral"),
-        }
-
-        name, css_class = display_names.get(self._type, ("Unknown", ""))
+        name, css_class = _BADGE_INFO.get(self._type, ("Unknown", ""))
         self.set_label(name)
+
+        # Swap type classes in one call so style is invalidated once
+        classes = [c for c in self.get_css_classes() if c not in _BADGE_CLASSES]
         if css_class:
-            self.add_css_class(css_class)
+            classes.append(css_class)
+        self.set_css_classes(classes)
 
     def set_type(self, interview_type: InterviewType) -> None:
         """Set the interview type."""
@@ -4,6 +4,8 @@ import gi
 gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk, GLib
 
+from functools import partial
+
 from interview_assistant.core.events import Event, get_event_bus
 
 
@@ -21,6 +23,18 @@ class StatusIndicator(Gtk.Box):
         ACTIVE = "active"
         ERROR = "error"
 
+    # Dot classes owned by set_state
+    _STATE_CLASSES = frozenset(("active", "recording", "processing", "error"))
+
+    # Indicator state entered on each event
+    _EVENT_TO_STATE = {
+        Event.RECORDING_STARTED: State.RECORDING,
+        Event.RECORDING_STOPPED: State.IDLE,
+        Event.AI_REQUEST_STARTED: State.PROCESSING,
+        Event.AI_RESPONSE_COMPLETE: State.ACTIVE,
+        Event.AI_ERROR: State.ERROR,
+    }
+
     def __init__(self):
         super().__init__(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
 
@@ -39,12 +53,17 @@ class StatusIndicator(Gtk.Box):
         self.append(self._label)
 
         # Subscribe to events
+        # Handlers are kept so cleanup() can unsubscribe the same objects
+        self._handlers = {
+            event: partial(self._on_state_event, state)
+            for event, state in self._EVENT_TO_STATE.items()
+        }
         self._event_bus = get_event_bus()
-        self._event_bus.subscribe(Event.RECORDING_STARTED, lambda _: self.set_state(self.State.RECORDING))
-        self._event_bus.subscribe(Event.RECORDING_STOPPED, lambda _: self.set_state(self.State.IDLE))
-        self._event_bus.subscribe(Event.AI_REQUEST_STARTED, lambda _: self.set_state(self.State.PROCESSING))
-        self._event_bus.subscribe(Event.AI_RESPONSE_COMPLETE, lambda _: self.set_state(self.State.ACTIVE))
-        self._event_bus.subscribe(Event.AI_ERROR, lambda _: self.set_state(self.State.ERROR))
+        self._event_bus.subscribe_many(self._handlers)
+
+    def _on_state_event(self, state: str, _) -> None:
+        """Switch to the state mapped to the received event."""
+        self.set_state(state)
 
     def set_state(self, state: str) -> None:
         """
@@ -55,11 +74,13 @@ class StatusIndicator(Gtk.Box):
         """
         self._state = state
 
-        # Remove old classes
-        for cls in ["active", "recording", "processing", "error"]:
-            self._dot.remove_css_class(cls)
+        # Swap state classes in one call so style is invalidated once
+        classes = [c for c in self._dot.get_css_classes() if c not in self._STATE_CLASSES]
+        if state != self.State.IDLE:
+            classes.append(state)
+        self._dot.set_css_classes(classes)
 
-        # Set new state
+        # Set new label
         labels = {
             self.State.IDLE: "Ready",
             self.State.RECORDING: "Recording...",
@@ -70,14 +91,16 @@ class StatusIndicator(Gtk.Box):
 
         self._label.set_label(labels.get(state, "Unknown"))
 
-        if state != self.State.IDLE:
-            self._dot.add_css_class(state)
-
     @property
     def state(self) -> str:
         """Get current state."""
         return self._state
 
+    def cleanup(self) -> None:
+        """Unsubscribe from events."""
+        for event, handler in self._handlers.items():
+            self._event_bus.unsubscribe(event, handler)
+
 
 class RecordButton(Gtk.ToggleButton):
     """
@@ -100,9 +123,12 @@ class RecordButton(Gtk.ToggleButton):
         self.connect("toggled", self._on_toggled)
 
         # Subscribe to events
+        self._handlers = {
+            Event.RECORDING_STARTED: self._on_recording_started,
+            Event.RECORDING_STOPPED: self._on_recording_stopped,
+        }
         self._event_bus = get_event_bus()
-        self._event_bus.subscribe(Event.RECORDING_STARTED, self._on_recording_started)
-        self._event_bus.subscribe(Event.RECORDING_STOPPED, self._on_recording_stopped)
+        self._event_bus.subscribe_many(self._handlers)
 
     def _on_toggled(self, button) -> None:
         """Handle button toggle."""
@@ -126,6 +152,11 @@ class RecordButton(Gtk.ToggleButton):
         """Check if recording."""
         return self.get_active()
 
+    def cleanup(self) -> None:
+        """Unsubscribe from events."""
+        for event, handler in self._handlers.items():
+            self._event_bus.unsubscribe(event, handler)
+
 
 class ProcessingSpinner(Gtk.Box):
     """
@@ -145,10 +176,21 @@ class ProcessingSpinner(Gtk.Box):
         self.set_visible(False)
 
         # Subscribe to events
+        self._handlers = {
+            Event.AI_REQUEST_STARTED: self._on_request_started,
+            Event.AI_RESPONSE_COMPLETE: self._on_request_finished,
+            Event.AI_ERROR: self._on_request_finished,
+        }
         self._event_bus = get_event_bus()
-        self._event_bus.subscribe(Event.AI_REQUEST_STARTED, lambda _: self.start())
-        self._event_bus.subscribe(Event.AI_RESPONSE_COMPLETE, lambda _: self.stop())
-        self._event_bus.subscribe(Event.AI_ERROR, lambda _: self.stop())
+        self._event_bus.subscribe_many(self._handlers)
+
+    def _on_request_started(self, _) -> None:
+        """Handle AI request started event."""
+        self.start()
+
+    def _on_request_finished(self, _) -> None:
+        """Handle AI response complete or error event."""
+        self.stop()
 
     def start(self, message: str = "Processing...") -> None:
         """Start the spinner."""
@@ -164,3 +206,8 @@ class ProcessingSpinner(Gtk.Box):
     def set_message(self, message: str) -> None:
         """Set the status message."""
         self._label.set_label(message)
+
+    def cleanup(self) -> None:
+        """Unsubscribe from events."""
+        for event, handler in self._handlers.items():
+            self._event_bus.unsubscribe(event, handler)